@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Time of validating one cell for each field type.
+
+    python benchmarks/fields.py [number]
+"""
+import datetime
+import sys
+import timeit
+
+from utils import setup_django
+
+setup_django()
+
+from django_excel_tools import fields  # noqa: E402
+
+CASES = [
+    ('BooleanField', fields.BooleanField(verbose_name='field'), 'Y'),
+    ('CharField', fields.CharField(max_length=20, verbose_name='field'), ' Shop A '),
+    ('CharField number', fields.CharField(max_length=20, verbose_name='field'), 1000),
+    ('CharField choices', fields.CharField(
+        max_length=20, verbose_name='field', choices=['Yes', 'No'], case_sensitive=False
+    ), 'yes'),
+    ('CharField cached', fields.CharField(
+        max_length=20, verbose_name='field', choices=['Yes', 'No'], case_sensitive=False, cache=True
+    ), 'yes'),
+    ('IntegerField', fields.IntegerField(verbose_name='field'), 100),
+    ('IntegerField text', fields.IntegerField(verbose_name='field'), '100'),
+    ('DecimalField', fields.DecimalField(verbose_name='field', decimal_places=2), 1.5),
+    ('FloatField text', fields.FloatField(verbose_name='field'), '1,234.5'),
+    ('DateField', fields.DateField(
+        verbose_name='field', date_format='%Y-%m-%d', date_format_verbose='YYYY-MM-DD'
+    ), datetime.datetime(2018, 1, 1)),
+    ('DateField text', fields.DateField(
+        verbose_name='field', date_format='%Y-%m-%d', date_format_verbose='YYYY-MM-DD'
+    ), '2018-01-01'),
+    ('DateField cached', fields.DateField(
+        verbose_name='field', date_format='%Y-%m-%d', date_format_verbose='YYYY-MM-DD', cache=True
+    ), '2018-01-01'),
+    ('DateTimeField int', fields.DateTimeField(
+        verbose_name='field', date_format='%Y%m%d%H%M%S', date_format_verbose='YYYYMMDDhhmmss'
+    ), 20180101090000),
+]
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print('{:<20} {:>10}'.format('field', 'ns/cell'))
+    for name, field, value in CASES:
+        def validate():
+            field.value = value
+            field.validate(index=1)
+        seconds = min(timeit.repeat(validate, number=number, repeat=3))
+        print('{:<20} {:>10.0f}'.format(name, seconds / number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Import time of the package modules measured with `python -X importtime`,
+each module in a fresh interpreter without Django settings.
+
+    python benchmarks/import_time.py
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = [
+    'django_excel_tools.fields',
+    'django_excel_tools.serializers',
+    'django_excel_tools.exporters',
+    'django_excel_tools.jobs',
+]
+
+
+def measure(module):
+    code = 'import sys, {}; print("django" in sys.modules)'.format(module)
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+    )
+    cumulative = 0
+    for line in process.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1])
+    return cumulative, process.stdout.strip() == 'True'
+
+
+def main():
+    print('{:<34} {:>10} {:>16}'.format('module', 'ms', 'imports django'))
+    for module in MODULES:
+        cumulative, django_imported = measure(module)
+        print('{:<34} {:>10.1f} {:>16}'.format(module, cumulative / 1000.0, str(django_imported)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Memory retained by cleaned_data for each Meta.row_type.
+
+    python benchmarks/row_memory.py [rows]
+"""
+import datetime
+import gc
+import sys
+import tracemalloc
+
+from utils import setup_django
+
+setup_django()
+
+from openpyxl import Workbook  # noqa: E402
+
+from django_excel_tools import serializers  # noqa: E402
+
+FIELDS = tuple('text_{}'.format(index) for index in range(6)) + \
+    tuple('number_{}'.format(index) for index in range(4)) + ('date', 'flag')
+
+
+def create_serializer_class(row_type):
+    attrs = dict(
+        (name, serializers.CharField(max_length=20, verbose_name=name)) for name in FIELDS[:6]
+    )
+    attrs.update(
+        (name, serializers.IntegerField(verbose_name=name)) for name in FIELDS[6:10]
+    )
+    attrs['date'] = serializers.DateField(
+        verbose_name='date', date_format='%Y-%m-%d', date_format_verbose='YYYY-MM-DD'
+    )
+    attrs['flag'] = serializers.BooleanField(verbose_name='flag')
+    # Only validation is measured, import_operation runs without a database
+    attrs['Meta'] = type('Meta', (), {
+        'start_index': 1, 'fields': FIELDS, 'row_type': row_type, 'enable_transaction': False
+    })
+    return type('Serializer', (serializers.ExcelSerializer,), attrs)
+
+
+def create_worksheet(rows):
+    worksheet = Workbook().active
+    worksheet.append(FIELDS)
+    date = datetime.datetime(2018, 1, 1)
+    for index in range(rows):
+        worksheet.append(
+            ['value {}'.format(index % 1000)] * 6 + [index] * 4 + [date, 'Y']
+        )
+    return worksheet
+
+
+def measure(serializer_class, worksheet):
+    gc.collect()
+    tracemalloc.start()
+    serializer = serializer_class(worksheet)
+    retained, peak = tracemalloc.get_traced_memory()
+    assert not serializer.validation_errors, serializer.validation_errors
+    rows = serializer.cleaned_data
+    del serializer
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    del rows
+    gc.collect()
+    freed = retained - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return freed, peak
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    worksheet = create_worksheet(rows)
+    print('{} rows x {} columns'.format(rows, len(FIELDS)))
+    print('{:<8} {:>16} {:>12} {:>12}'.format('row_type', 'cleaned_data MB', 'bytes/row', 'peak MB'))
+    for row_type in ('dict', 'record', 'tuple'):
+        size, peak = measure(create_serializer_class(row_type), worksheet)
+        print('{:<8} {:>16.1f} {:>12.0f} {:>12.1f}'.format(
+            row_type, size / 1024.0 / 1024, size / float(rows), peak / 1024.0 / 1024
+        ))
+
+
+if __name__ == '__main__':
+    main()
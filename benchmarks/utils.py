@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""Shared setup of the benchmark scripts, run them from the repository root."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def setup_django():
+    import django
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(USE_I18N=False)
+        django.setup()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Sheet level rules checked on values accumulated over the valid rows, e.g.
+the total quantity of each shop. Only one value per group is kept, cleaned
+rows are not needed so aggregates work with ImportJob too.
+
+    class Meta:
+        aggregates = [
+            Sum('quantity', group_by='shop', max_value=lambda shop: stocks[shop]),
+            Count(group_by='invoice_number', max_value=100),
+        ]
+"""
+from .utils import _, gettext_noop
+
+
+class BaseAggregate(object):
+    """
+    :param field: name of the aggregated field
+    :param group_by: name of the field grouping rows, None for the whole sheet
+    :param min_value, max_value: limit or callable returning the limit of a
+        group, None is not checked
+    :param check: callable(group, value) returning an error message or None
+    """
+    function_name = None
+
+    def __init__(self, field=None, group_by=None, min_value=None, max_value=None, check=None):
+        self.field = field
+        self.group_by = group_by
+        self.min_value = min_value
+        self.max_value = max_value
+        self.check = check
+
+    def accumulate(self, current, value):
+        raise NotImplementedError
+
+    def get_limit(self, limit, group):
+        if callable(limit):
+            return limit(group)
+        return limit
+
+    def validate(self, group, value):
+        """
+        :return: error message or None
+        """
+        limit = self.get_limit(self.min_value, group)
+        if limit is not None and value < limit:
+            return _('must be greater than or equal to %(limit)s.') % {'limit': limit}
+        limit = self.get_limit(self.max_value, group)
+        if limit is not None and value > limit:
+            return _('must be less than or equal to %(limit)s.') % {'limit': limit}
+        if self.check is not None:
+            return self.check(group, value)
+        return None
+
+
+class Sum(BaseAggregate):
+    function_name = gettext_noop('Sum')
+
+    def accumulate(self, current, value):
+        return value if current is None else current + value
+
+
+class Count(BaseAggregate):
+    """
+    Number of valid rows, or rows where field is not blank
+    """
+    function_name = gettext_noop('Count')
+
+    def accumulate(self, current, value):
+        return 1 if current is None else current + 1
+
+
+class Min(BaseAggregate):
+    function_name = gettext_noop('Min')
+
+    def accumulate(self, current, value):
+        return value if current is None or value < current else current
+
+
+class Max(BaseAggregate):
+    function_name = gettext_noop('Max')
+
+    def accumulate(self, current, value):
+        return value if current is None or value > current else current
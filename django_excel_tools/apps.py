@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class DjangoExcelToolsConfig(AppConfig):
+    name = 'django_excel_tools'
+    verbose_name = 'Django Excel Tools'
+    default_auto_field = 'django.db.models.AutoField'
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Import many files with the same serializer. Files are validated in parallel
+worker processes, imports are limited to `import_workers` at a time so the
+database is not flooded with concurrent transactions.
+"""
+import glob
+import logging
+import multiprocessing
+import os
+import time
+
+log = logging.getLogger(__name__)
+
+# Lock limiting concurrent imports, set in each worker process
+_import_lock = None
+
+
+class FileReport(object):
+    VALID = 'valid'
+    INVALID = 'invalid'
+    IMPORTED = 'imported'
+    FAILED = 'failed'
+    ERROR = 'error'
+
+    def __init__(self, path, status, rows=0, errors=None, validate_seconds=0.0, import_seconds=0.0):
+        self.path = path
+        self.status = status
+        self.rows = rows
+        self.errors = errors or []
+        self.validate_seconds = validate_seconds
+        self.import_seconds = import_seconds
+
+    def __repr__(self):
+        return '<FileReport- {} {}>'.format(self.path, self.status)
+
+
+class BatchReport(object):
+
+    def __init__(self, files, seconds):
+        self.files = files
+        self.seconds = seconds
+
+    def count(self, status):
+        return sum(1 for report in self.files if report.status == status)
+
+    @property
+    def is_success(self):
+        return all(report.status in (FileReport.VALID, FileReport.IMPORTED) for report in self.files)
+
+    def as_table(self):
+        """
+        Text table of each file with its status, rows and timings
+        """
+        lines = ['{:<40} {:<9} {:>8} {:>7} {:>10} {:>10}'.format(
+            'file', 'status', 'rows', 'errors', 'validate s', 'import s'
+        )]
+        for report in self.files:
+            lines.append('{:<40} {:<9} {:>8} {:>7} {:>10.2f} {:>10.2f}'.format(
+                os.path.basename(report.path), report.status, report.rows, len(report.errors),
+                report.validate_seconds, report.import_seconds
+            ))
+        lines.append('{} files in {:.2f}s'.format(len(self.files), self.seconds))
+        return '\n'.join(lines)
+
+
+def collect_files(source, pattern='*.xlsx'):
+    """
+    Sorted file paths of a directory, a glob or a list of paths
+    """
+    if not isinstance(source, str):
+        return list(source)
+    if os.path.isdir(source):
+        source = os.path.join(source, pattern)
+    return sorted(glob.glob(source))
+
+
+def _init_worker(import_lock):
+    global _import_lock
+    _import_lock = import_lock
+
+    # Spawned processes start without Django set up
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+
+
+def import_file(serializer_class, path, sheet_name=None, dry_run=False, chunk_size=None, max_errors=None,
+                **kwargs):
+    """
+    Validate and import one file. In a batch worker process the import waits
+    for the batch import lock and database connections are closed when the
+    file is done.
+    :param serializer_class: serializer class or its dotted path
+    :param chunk_size: import the file with ImportJob in chunks of this many
+        rows, each chunk in its own transaction. Rows of the chunks before an
+        invalid chunk stay imported.
+    :param max_errors: stop validating the file after this many errors
+    :return: FileReport
+    """
+    from django.db import connections
+    from django.utils.module_loading import import_string
+    from openpyxl import load_workbook
+
+    if isinstance(serializer_class, str):
+        serializer_class = import_string(serializer_class)
+
+    started = time.perf_counter()
+    workbook = None
+    try:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        if chunk_size and not dry_run:
+            return _import_chunks(serializer_class, path, worksheet, chunk_size, max_errors, started, **kwargs)
+
+        serializer = serializer_class.prepare(worksheet, **kwargs)
+        if chunk_size:
+            serializer.meta.chunk_size = chunk_size
+        serializer._validate_worksheet(max_errors)
+        validate_seconds = time.perf_counter() - started
+
+        if serializer.validation_errors:
+            serializer.invalid(serializer.validation_errors)
+            return FileReport(
+                path, FileReport.INVALID, errors=serializer.validation_errors, validate_seconds=validate_seconds
+            )
+        serializer.validated()
+        rows = len(serializer.cleaned_data)
+        if dry_run:
+            return FileReport(path, FileReport.VALID, rows=rows, validate_seconds=validate_seconds)
+
+        started = time.perf_counter()
+        if _import_lock is None:
+            serializer._start_operation()
+        else:
+            with _import_lock:
+                serializer._start_operation()
+        import_seconds = time.perf_counter() - started
+
+        if serializer.operation_errors:
+            return FileReport(
+                path, FileReport.FAILED, rows=rows, errors=serializer.operation_errors,
+                validate_seconds=validate_seconds, import_seconds=import_seconds
+            )
+        return FileReport(
+            path, FileReport.IMPORTED, rows=rows, validate_seconds=validate_seconds, import_seconds=import_seconds
+        )
+    except Exception as error:
+        log.exception('Batch import of %s failed', path)
+        return FileReport(
+            path, FileReport.ERROR, errors=[repr(error)], validate_seconds=time.perf_counter() - started
+        )
+    finally:
+        if workbook is not None:
+            workbook.close()
+        if _import_lock is not None:
+            connections.close_all()
+
+
+def _import_chunks(serializer_class, path, worksheet, chunk_size, max_errors, started, **kwargs):
+    """
+    Validate and import the worksheet chunk by chunk with ImportJob, the
+    checkpoint is kept for this run only. The batch import lock is held while
+    a chunk is imported, not while rows are validated.
+    """
+    from django_excel_tools.jobs import Checkpoint, ImportJob, MemoryCheckpointStore
+
+    job = ImportJob(
+        serializer_class, worksheet, job_id=path, store=MemoryCheckpointStore(), chunk_size=chunk_size,
+        lock=_import_lock, max_errors=max_errors, **kwargs
+    )
+    checkpoint = job.run()
+    # Validation and import of the chunks are interleaved
+    import_seconds = time.perf_counter() - started
+
+    serializer = job.serializer
+    if checkpoint.status == Checkpoint.INVALID:
+        status, errors = FileReport.INVALID, serializer.validation_errors
+    elif checkpoint.status == Checkpoint.FAILED:
+        status, errors = FileReport.FAILED, serializer.operation_errors
+    else:
+        status, errors = FileReport.IMPORTED, []
+    return FileReport(path, status, rows=checkpoint.imported_rows, errors=errors, import_seconds=import_seconds)
+
+
+def _import_file(args):
+    serializer_class, path, kwargs = args
+    return import_file(serializer_class, path, **kwargs)
+
+
+def run_batch(serializer_class, source, workers=None, import_workers=1, pattern='*.xlsx', sheet_name=None,
+              dry_run=False, chunk_size=None, max_errors=None, **kwargs):
+    """
+    Validate files of source in `workers` processes, at most `import_workers`
+    of them import at the same time. With workers=1 files are processed in
+    this process one by one.
+    :param serializer_class: serializer class or its dotted path, classes must
+        be importable by the worker processes
+    :param source: directory, glob or list of paths
+    :param chunk_size, max_errors: see import_file
+    :return: BatchReport with reports in the order of the files
+    """
+    from django.db import connections
+
+    paths = collect_files(source, pattern)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(paths)) or 1
+    kwargs.update(sheet_name=sheet_name, dry_run=dry_run, chunk_size=chunk_size, max_errors=max_errors)
+    tasks = [(serializer_class, path, kwargs) for path in paths]
+
+    started = time.perf_counter()
+    if workers == 1:
+        reports = [_import_file(task) for task in tasks]
+    else:
+        # Forked workers must not share the connections of this process
+        connections.close_all()
+        import_lock = multiprocessing.Semaphore(import_workers)
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(import_lock,))
+        try:
+            reports = pool.map(_import_file, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    return BatchReport(reports, time.perf_counter() - started)
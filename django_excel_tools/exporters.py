@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from io import BytesIO
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.comments import Comment
+from openpyxl.styles import PatternFill
+from openpyxl.utils import get_column_letter, quote_sheetname
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from django_excel_tools import fields as excel_fields
+
+ERROR_FILL = PatternFill(fill_type='solid', fgColor='FFC7CE')
+ERROR_COMMENT_AUTHOR = 'django-excel-tools'
+
+# Last row of data validations when Meta.max_rows is not set
+TEMPLATE_MAX_ROW = 1048576
+# Hidden sheet holding choices too long for an inline dropdown list
+TEMPLATE_CHOICES_SHEET = 'choices'
+# Excel limit of an inline list of a data validation
+INLINE_CHOICES_LENGTH = 255
+
+
+def get_header_rows(serializer_class):
+    """
+    Rows written before data so that Meta.start_index still points to the
+    first data row when the file is imported back. Verbose names are used as
+    the header of the last of those rows.
+    """
+    meta = serializer_class.Meta
+    fields = serializer_class.get_declared_fields()
+    if meta.start_index < 1:
+        return []
+    rows = [[] for _ in range(meta.start_index - 1)]
+    rows.append([field.verbose_name for field in fields.values()])
+    return rows
+
+
+def iter_export_rows(serializer_class, queryset, chunk_size=2000):
+    """
+    Yield data rows formatted by each field. QuerySets are read with
+    `values_list` and `iterator` so no model instance is created or cached.
+
+    Field names are used as lookups unless `Meta.export_sources` maps a field
+    name to another lookup, e.g. {'shop_name': 'shop__name'}.
+    """
+    fields = serializer_class.get_declared_fields()
+    sources = getattr(serializer_class.Meta, 'export_sources', {})
+    lookups = [sources.get(name, name) for name in fields.keys()]
+    converters = [field.to_excel for field in fields.values()]
+
+    if hasattr(queryset, 'values_list'):
+        rows = queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
+    else:
+        rows = queryset
+
+    for row in rows:
+        if isinstance(row, dict):
+            row = [row.get(lookup) for lookup in lookups]
+        yield [convert(value) for convert, value in zip(converters, row)]
+
+
+def export_workbook(serializer_class, queryset, fileobj, chunk_size=2000, title=None):
+    """
+    Stream queryset into a write-only workbook saved to fileobj, memory stays
+    constant regardless of the number of rows.
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=title)
+    for row in get_header_rows(serializer_class):
+        worksheet.append(row)
+    for row in iter_export_rows(serializer_class, queryset, chunk_size):
+        worksheet.append(row)
+    workbook.save(fileobj)
+    return fileobj
+
+
+def write_error_workbook(worksheet, error_records, fileobj, title=None):
+    """
+    Copy worksheet values into a write-only workbook in a single pass. Cells
+    of error records are highlighted and commented, errors of a whole row are
+    attached to the first cell of that row. Only the cells with errors get a
+    style, the rest of the sheet is written as plain values.
+    """
+    errors = {}
+    for record in error_records:
+        if record.row is None:
+            continue
+        row_errors = errors.setdefault(record.row, {})
+        row_errors.setdefault(record.column or 1, []).append(record.message)
+
+    workbook = Workbook(write_only=True)
+    output = workbook.create_sheet(title=title or worksheet.title)
+    for row_number, values in enumerate(worksheet.iter_rows(values_only=True), start=1):
+        row_errors = errors.get(row_number)
+        if not row_errors:
+            output.append(values)
+            continue
+
+        values = list(values)
+        last_column = max(row_errors)
+        if len(values) < last_column:
+            values.extend([None] * (last_column - len(values)))
+        for column, messages in row_errors.items():
+            cell = WriteOnlyCell(output, value=values[column - 1])
+            cell.fill = ERROR_FILL
+            cell.comment = Comment(u'\n'.join(messages), ERROR_COMMENT_AUTHOR)
+            values[column - 1] = cell
+        output.append(values)
+
+    workbook.save(fileobj)
+    return fileobj
+
+
+def get_template_number_format(field):
+    """
+    Number format of the column of field in templates, None keeps General
+    """
+    if isinstance(field, excel_fields.CharField):
+        # Text format keeps codes like 0012 as typed
+        return '@'
+    if isinstance(field, excel_fields.IntegerField):
+        return '0'
+    if isinstance(field, excel_fields.DecimalField) and field.decimal_places is not None:
+        return '0.{}'.format('0' * field.decimal_places) if field.decimal_places else '0'
+    if isinstance(field, excel_fields.DateTimeField):
+        return 'yyyy-mm-dd hh:mm:ss'
+    if isinstance(field, excel_fields.DateField):
+        return 'yyyy-mm-dd'
+    return None
+
+
+def _can_inline_choices(choices):
+    text = ','.join(str(choice) for choice in choices)
+    return len(text) <= INLINE_CHOICES_LENGTH and text.count(',') == len(choices) - 1 and '"' not in text
+
+
+def get_template_validation(field, choices_range=None):
+    """
+    Data validation of the column of field in templates
+    :param choices_range: cell range holding the choices of field
+    """
+    options = {'allow_blank': field.blank, 'showErrorMessage': True}
+    choices = getattr(field, 'choices', None)
+    if choices:
+        if choices_range is None:
+            choices_range = '"{}"'.format(','.join(str(choice) for choice in choices))
+        return DataValidation(type='list', formula1=choices_range, **options)
+
+    if isinstance(field, excel_fields.CharField) and not isinstance(field, excel_fields.RegexField):
+        return DataValidation(
+            type='textLength', operator='lessThanOrEqual', formula1=str(field.max_length), **options
+        )
+
+    if isinstance(field, excel_fields.BaseNumberField):
+        min_value, max_value = field.min_value, field.max_value
+        if min_value is not None and max_value is not None:
+            return DataValidation(
+                type='decimal', operator='between', formula1=str(min_value), formula2=str(max_value), **options
+            )
+        if min_value is not None:
+            return DataValidation(
+                type='decimal', operator='greaterThanOrEqual', formula1=str(min_value), **options
+            )
+        if max_value is not None:
+            return DataValidation(type='decimal', operator='lessThanOrEqual', formula1=str(max_value), **options)
+    return None
+
+
+def build_template(serializer_class, fileobj, sample_rows=None):
+    """
+    Write an empty import template in write-only mode: header rows from
+    verbose names, a dropdown for fields with choices, length and range
+    validations, and number formats of the columns. sample_rows are written
+    below the header like exported rows.
+    """
+    meta = serializer_class.Meta
+    fields = serializer_class.get_declared_fields()
+    first_row = meta.start_index + 1
+    last_row = TEMPLATE_MAX_ROW
+    if getattr(meta, 'max_rows', None):
+        last_row = min(meta.start_index + meta.max_rows, TEMPLATE_MAX_ROW)
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=serializer_class.__name__[:31])
+    long_choices = []
+    for column, field in enumerate(fields.values(), start=1):
+        letter = get_column_letter(column)
+        worksheet.column_dimensions[letter].width = max(len(str(field.verbose_name)) + 2, 10)
+        number_format = get_template_number_format(field)
+        if number_format is not None:
+            worksheet.column_dimensions[letter].number_format = number_format
+
+        choices = getattr(field, 'choices', None)
+        choices_range = None
+        if choices and not _can_inline_choices(choices):
+            long_choices.append(choices)
+            choices_letter = get_column_letter(len(long_choices))
+            choices_range = '{}!${}$1:${}${}'.format(
+                quote_sheetname(TEMPLATE_CHOICES_SHEET), choices_letter, choices_letter, len(choices)
+            )
+        validation = get_template_validation(field, choices_range)
+        if validation is not None:
+            validation.add('{}{}:{}{}'.format(letter, first_row, letter, last_row))
+            worksheet.data_validations.append(validation)
+
+    for row in get_header_rows(serializer_class):
+        worksheet.append(row)
+    if sample_rows is not None:
+        for row in iter_export_rows(serializer_class, sample_rows):
+            worksheet.append(row)
+
+    if long_choices:
+        choices_sheet = workbook.create_sheet(title=TEMPLATE_CHOICES_SHEET)
+        choices_sheet.sheet_state = 'hidden'
+        for index in range(max(len(choices) for choices in long_choices)):
+            choices_sheet.append([choices[index] if index < len(choices) else None for choices in long_choices])
+
+    workbook.save(fileobj)
+    return fileobj
+
+
+def get_template_bytes(serializer_class):
+    """
+    Template of serializer_class without sample rows, built once per class
+    """
+    content = serializer_class.__dict__.get('_template_bytes')
+    if content is None:
+        content = build_template(serializer_class, BytesIO()).getvalue()
+        serializer_class._template_bytes = content
+    return content
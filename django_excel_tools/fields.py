@@ -1,29 +1,65 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import sys
 import datetime
+import decimal
+import math
+import re
+import sys
 
 from .exceptions import ValidationError, SerializerConfigError
-from .utils import error_trans
-
-try:
-    import django
-    major, feature, minor, a, b = django.VERSION
-    if major >= 2:
-        from django.utils.translation import gettext as _
-    else:
-        from django.utils.translation import ugettext as _
-except ImportError:
-    raise SerializerConfigError('Django is required. Please make sure you '
-                                'have install via pip.')
+from .utils import _, error_trans, gettext_noop
+from .validators import EmailValidator, MaxValueValidator, MinValueValidator, RegexValidator
+
+BLANK_VALUES = ('', None)
+# Cleaned values kept per cached field, the cache is emptied when it is full
+FIELD_CACHE_SIZE = 1024
+# cache='auto' stops caching when more than half of this many values are distinct
+FIELD_CACHE_PROBE_SIZE = 1000
+# Decimal texts up to the digits of the default context precision are padded
+# to decimal_places instead of quantized
+DECIMAL_PAD_MAX_LENGTH = 28
+
+# Syntax of Python patterns that JSON schema (ECMA-262) regexes don't have:
+# \A and \Z anchors, (?P...) groups, comments and inline flags
+PYTHON_ONLY_REGEX = re.compile(r'\\[AZ]|\(\?[P#aiLmsux-]')
+# Flags that can't be written in a JSON schema pattern
+PYTHON_ONLY_FLAGS = re.IGNORECASE | re.LOCALE | re.MULTILINE | re.DOTALL | re.VERBOSE
+# Number text for each decimal separator. Thousand groups have 3 digits and one
+# separator, so "1.234,50" is rejected with "." instead of read as 1.23
+NUMBER_TEXT_PATTERNS = {
+    '.': re.compile(r'[+-]?(?:\d{1,3}(?:([, \xa0])\d{3})(?:\1\d{3})*|\d*)(?:\.\d*)?(?:[eE][+-]?\d+)?\Z'),
+    ',': re.compile(r'[+-]?(?:\d{1,3}(?:([. \xa0])\d{3})(?:\1\d{3})*|\d*)(?:,\d*)?(?:[eE][+-]?\d+)?\Z'),
+}
+
+
+def _spec_value(value):
+    """
+    Value that can be written as JSON
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
 
 
 class BaseField(object):
+    # Name of the field type in specs and schemas
+    field_type = None
 
-    def __init__(self, verbose_name, blank=False, default=None):
+    def __init__(self, verbose_name, blank=False, default=None, validators=None, cache=False):
         self.verbose_name = verbose_name
         self.blank = blank
         self.default = default
+        # Called in order with the cleaned value, stop at the first failure
+        self.validators = tuple(validators or ())
+        if cache not in (True, False, 'auto'):
+            raise SerializerConfigError(message='cache must be True, False or "auto".')
+        self.cache = cache
+        # (type, raw value) -> cleaned value of valid cells
+        self.cleaned_cache = {} if cache else None
+        # Values seen while cache='auto' is deciding whether to keep caching
+        self.cache_lookups = 0 if cache == 'auto' else None
         self.value = None
         self.cleaned_value = None
 
@@ -32,36 +68,114 @@ class BaseField(object):
         self.cleaned_value = None
 
     def validate(self, index):
+        if self.cleaned_cache is None or self.value in BLANK_VALUES:
+            self._validate(index)
+            return
+
+        if self.cache_lookups is not None:
+            self._probe_cache()
+            if self.cleaned_cache is None:
+                self._validate(index)
+                return
+
+        # Type is part of the key so 1, 1.0 and True are cached separately
+        key = (type(self.value), self.value)
+        try:
+            self.cleaned_value = self.cleaned_cache[key]
+            return
+        except KeyError:
+            pass
+        self._validate(index)
+        self._cache_cleaned_value(key)
+
+    def _validate(self, index):
         validating_value = self.strip_value_space()
         validating_value = self.validate_blank(validating_value, index)
-        if validating_value in ['', None]:
+        if validating_value in BLANK_VALUES:
             self.cleaned_value = validating_value
         else:
             validating_value = self.validate_specific_data_type(validating_value, index)
+            if self.validators:
+                self.run_validators(validating_value, index)
             self.cleaned_value = validating_value
 
+    def _cache_cleaned_value(self, key):
+        """
+        Keep the cleaned value of a valid cell, text is interned so repeated
+        values share one string in cleaned data
+        """
+        cleaned_cache = self.cleaned_cache
+        if type(self.cleaned_value) is str:
+            self.cleaned_value = sys.intern(self.cleaned_value)
+        if len(cleaned_cache) >= FIELD_CACHE_SIZE:
+            cleaned_cache.clear()
+        cleaned_cache[key] = self.cleaned_value
+
+    def _probe_cache(self):
+        """
+        Decide after FIELD_CACHE_PROBE_SIZE values whether cache='auto' keeps
+        caching, a column of mostly distinct values is validated without cache
+        """
+        self.cache_lookups += 1
+        if self.cache_lookups < FIELD_CACHE_PROBE_SIZE:
+            return
+        if len(self.cleaned_cache) * 2 > FIELD_CACHE_PROBE_SIZE:
+            self.cleaned_cache = None
+        self.cache_lookups = None
+
+    def clear_cache(self):
+        if self.cleaned_cache is not None:
+            self.cleaned_cache.clear()
+
+    def run_validators(self, validating_value, index):
+        for validator in self.validators:
+            try:
+                validator(validating_value)
+            except ValidationError as error:
+                msg = error_trans(index, self.verbose_name, error.message)
+                raise ValidationError(message=msg)
+
     def validate_blank(self, validating_value, index):
-        blank_values = ['', None]
-        if not self.blank and validating_value in blank_values:
+        if not self.blank and validating_value in BLANK_VALUES:
             msg = error_trans(index, self.verbose_name, _('is not allow to be blank.'))
             raise ValidationError(message=msg)
 
-        if self.blank and validating_value in blank_values and self.default is not None:
+        if self.blank and validating_value in BLANK_VALUES and self.default is not None:
             return self.default
 
         return validating_value
 
     def strip_value_space(self):
-        str_types = [str]
-        if sys.version_info < (3, 0):
-            str_types.append(unicode)
-        if type(self.value) in str_types:
+        if type(self.value) is str:
             return self.value.strip()
         return self.value
 
     def validate_specific_data_type(self, validating_value, index):
         pass
 
+    def to_excel(self, value):
+        """
+        Convert python value back to the cell value this field accepts.
+        """
+        return value
+
+    def get_spec(self):
+        """
+        Rules of this field as a dict of JSON values
+        """
+        return {
+            'type': self.field_type,
+            'verbose_name': self.verbose_name,
+            'blank': self.blank,
+            'default': _spec_value(self.default),
+        }
+
+    def get_json_schema(self):
+        """
+        JSON schema of the cleaned value
+        """
+        return {'title': self.verbose_name}
+
     def validate_default(self, validating_value):
         if self.default is not None and validating_value is None:
             return self.default
@@ -76,17 +190,27 @@ class BaseField(object):
             msg = error_trans(index, self.verbose_name, error_message)
             raise ValidationError(message=msg)
 
-    def _choice_validation_helper(self, index, value, choices, case_sensitive=True):
-        # Check if choices has duplication
+    @staticmethod
+    def _prepare_choices(choices, case_sensitive=True):
+        """
+        Set of accepted values, built once instead of for every cell
+        """
+        if not choices:
+            return None
         if len(choices) != len(set(choices)):
             raise SerializerConfigError(message='Choice has duplication.')
+        if not case_sensitive:
+            return frozenset(choice.lower() for choice in choices)
+        return frozenset(choices)
 
+    def _choice_validation_helper(self, index, value, choices, case_sensitive=True):
         if not case_sensitive:
             value = value.lower()
-            choices = [choice.lower() for choice in choices]
 
-        if value not in choices:
-            choices = u', '.join(choices)
+        if value not in self.choice_set:
+            if not case_sensitive:
+                choices = [choice.lower() for choice in choices]
+            choices = u', '.join(str(choice) for choice in choices)
             data = {'value': value, 'choices': choices}
             msg = _('%(value)s is not correct, '
                     'it must has one of these %(choices)s.')
@@ -102,22 +226,98 @@ class BaseField(object):
 
 class DigitBaseField(BaseField):
 
-    def __init__(self, verbose_name, default=None, convert_str=True, blank=False, choices=None):
-        super(DigitBaseField, self).__init__(verbose_name, blank)
+    def __init__(self, verbose_name, default=None, convert_str=True, blank=False, choices=None, validators=None,
+                 cache=False):
+        super(DigitBaseField, self).__init__(verbose_name, blank, validators=validators, cache=cache)
         self.convert_str = convert_str
         self.default = default
         self.choices = choices
+        self.choice_set = self._prepare_choices(choices)
+
+
+class BaseNumberField(BaseField):
+    """
+    Base of fields with decimal numbers. Numeric cells are converted directly,
+    text cells such as "1,234.50" or "1.234,50" are checked against the
+    pattern of the decimal separator and normalized.
+    """
+
+    def __init__(self, verbose_name, blank=False, default=None, min_value=None, max_value=None,
+                 decimal_separator='.', validators=None, cache=False):
+        range_validators = []
+        if min_value is not None:
+            range_validators.append(MinValueValidator(min_value))
+        if max_value is not None:
+            range_validators.append(MaxValueValidator(max_value))
+        super(BaseNumberField, self).__init__(
+            verbose_name, blank, default, validators=range_validators + list(validators or ()), cache=cache
+        )
+        if decimal_separator not in ['.', ',']:
+            raise SerializerConfigError(message='decimal_separator must be "." or ",".')
+        self.min_value = min_value
+        self.max_value = max_value
+        self.decimal_separator = decimal_separator
+        self._number_pattern = NUMBER_TEXT_PATTERNS[decimal_separator]
+        # Text without these characters is converted without the pattern
+        self._separator_chars = (',', ' ', u'\xa0') if decimal_separator == '.' else (',', '.', ' ', u'\xa0')
+
+    def normalize_number(self, validating_value, index):
+        """
+        Number text without thousand separators and with "." as decimal
+        separator, text in another format is rejected instead of guessed
+        """
+        for char in self._separator_chars:
+            if char in validating_value:
+                break
+        else:
+            return validating_value
+        match = self._number_pattern.match(validating_value)
+        if match is None:
+            raise self._number_error(validating_value, index)
+        thousand_separator = match.group(1)
+        if thousand_separator is not None:
+            validating_value = validating_value.replace(thousand_separator, '')
+        if self.decimal_separator != '.':
+            validating_value = validating_value.replace(',', '.')
+        return validating_value
+
+    def _number_error(self, validating_value, index):
+        msg = _('cannot convert %(value)s to number.')
+        msg = error_trans(
+            index=index,
+            verbose_name=self.verbose_name,
+            message=msg % {'value': validating_value}
+        )
+        return ValidationError(message=msg)
+
+    def get_spec(self):
+        spec = super(BaseNumberField, self).get_spec()
+        spec.update(
+            min_value=_spec_value(self.min_value),
+            max_value=_spec_value(self.max_value),
+            decimal_separator=self.decimal_separator
+        )
+        return spec
+
+    def get_json_schema(self):
+        schema = super(BaseNumberField, self).get_json_schema()
+        schema['type'] = 'number'
+        if self.min_value is not None:
+            schema['minimum'] = float(self.min_value)
+        if self.max_value is not None:
+            schema['maximum'] = float(self.max_value)
+        return schema
 
 
 class BaseDateTimeField(BaseField):
 
-    def __init__(self, date_format, date_format_verbose, verbose_name, blank=False):
-        super(BaseDateTimeField, self).__init__(verbose_name, blank)
+    def __init__(self, date_format, date_format_verbose, verbose_name, blank=False, validators=None, cache=False):
+        super(BaseDateTimeField, self).__init__(verbose_name, blank, validators=validators, cache=cache)
         self.date_format = date_format
         self.date_format_verbose = date_format_verbose
 
     def convert_datetime(self, validating_value, index):
-        if self.blank and validating_value in ['', None]:
+        if self.blank and validating_value in BLANK_VALUES:
             return None
 
         try:
@@ -132,49 +332,69 @@ class BaseDateTimeField(BaseField):
             msg = error_trans(index, self.verbose_name, msg % data)
             raise ValidationError(message=msg)
 
+    def to_excel(self, value):
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            return value.strftime(self.date_format)
+        return value
+
+    def get_spec(self):
+        spec = super(BaseDateTimeField, self).get_spec()
+        spec.update(date_format=self.date_format, date_format_verbose=self.date_format_verbose)
+        return spec
+
+    def get_json_schema(self):
+        schema = super(BaseDateTimeField, self).get_json_schema()
+        schema.update(type='string', format=self.json_format)
+        return schema
+
     @staticmethod
     def convert_int_to_str(validating_value):
         if type(validating_value) is int:
-            str_type = str if sys.version_info >= (3, 0) else unicode
-            return str_type(validating_value)
+            return str(validating_value)
         return validating_value
 
 
 class BooleanField(BaseField):
 
-    def __init__(self, verbose_name):
-        super(BooleanField, self).__init__(verbose_name=verbose_name, blank=True, default=False)
+    def __init__(self, verbose_name, validators=None, cache=False):
+        super(BooleanField, self).__init__(
+            verbose_name=verbose_name, blank=True, default=False, validators=validators, cache=cache
+        )
+
+    field_type = 'boolean'
 
     def validate_specific_data_type(self, validating_value, index):
         return True if validating_value else False
 
+    def get_json_schema(self):
+        schema = super(BooleanField, self).get_json_schema()
+        schema['type'] = 'boolean'
+        return schema
+
 
 class CharField(BaseField):
+    field_type = 'char'
 
-    def __init__(self, max_length, verbose_name, convert_number=True, blank=False, choices=None, default=None, case_sensitive=True):
-        super(CharField, self).__init__(verbose_name, blank, default)
+    def __init__(self, max_length, verbose_name, convert_number=True, blank=False, choices=None, default=None,
+                 case_sensitive=True, validators=None, cache=False):
+        super(CharField, self).__init__(verbose_name, blank, default, validators, cache)
         self.max_length = max_length
         self.convert_number = convert_number
         self.choices = choices
         self.case_sensitive = case_sensitive
+        self.choice_set = self._prepare_choices(choices, case_sensitive)
 
     def validate_specific_data_type(self, validating_value, index):
-        str_type = str if sys.version_info >= (3, 0) else unicode
         if self.convert_number:
-            validating_value = str_type(validating_value)
-
-        type_error_message = error_trans(
-            index=index,
-            verbose_name=self.verbose_name,
-            message=_('must be text.')
-        )
-
-        str_types = [str]
-        if sys.version_info <= (3, 0):
-            str_types.append(unicode)
+            validating_value = str(validating_value)
 
-        if type(validating_value) not in str_types:
-            raise ValidationError(message=type_error_message)
+        if type(validating_value) is not str:
+            msg = error_trans(
+                index=index,
+                verbose_name=self.verbose_name,
+                message=_('must be text.')
+            )
+            raise ValidationError(message=msg)
 
         if len(validating_value) > self.max_length:
             msg = _('cannot be more than %(length)s character.')
@@ -190,8 +410,130 @@ class CharField(BaseField):
 
         return validating_value
 
+    def to_excel(self, value):
+        # Export the declared spelling of a choice
+        if self.choices and not self.case_sensitive and value is not None:
+            lowered = value.lower()
+            for choice in self.choices:
+                if choice.lower() == lowered:
+                    return choice
+        return value
+
+    def get_spec(self):
+        spec = super(CharField, self).get_spec()
+        spec.update(
+            max_length=self.max_length,
+            choices=list(self.choices) if self.choices else None,
+            case_sensitive=self.case_sensitive
+        )
+        return spec
+
+    def get_json_schema(self):
+        schema = super(CharField, self).get_json_schema()
+        schema.update(type='string', maxLength=self.max_length)
+        if self.choices and self.case_sensitive:
+            schema['enum'] = list(self.choices)
+        return schema
+
+
+class RegexField(CharField):
+    """
+    Text that must match `regex`, the pattern is compiled once when the field
+    is declared. `transform` is called with the text before it is validated,
+    e.g. to upper-case codes or to strip hyphens, and its result is the
+    cleaned value.
+    """
+    field_type = 'regex'
+    regex = None
+    regex_flags = 0
+    error_message = None
+    # Pattern of the JSON schema when regex uses Python only syntax
+    json_pattern = None
+
+    def __init__(self, max_length, verbose_name, regex=None, transform=None, error_message=None, flags=None,
+                 **kwargs):
+        if regex is None:
+            regex = self.regex
+        if regex is None:
+            raise SerializerConfigError(message='regex is required.')
+        self.regex_validator = self.get_regex_validator(
+            regex,
+            error_message or self.error_message,
+            self.regex_flags if flags is None else flags
+        )
+        kwargs['validators'] = [self.regex_validator] + list(kwargs.get('validators') or ())
+        super(RegexField, self).__init__(max_length, verbose_name, **kwargs)
+        self.transform = transform
+
+    def get_regex_validator(self, regex, message, flags):
+        return RegexValidator(regex, message=message, flags=flags)
+
+    def get_spec(self):
+        spec = super(RegexField, self).get_spec()
+        spec['regex'] = self.regex_validator.pattern.pattern
+        return spec
+
+    def get_json_schema(self):
+        schema = super(RegexField, self).get_json_schema()
+        pattern = self.get_json_pattern()
+        if pattern is not None:
+            schema['pattern'] = pattern
+        return schema
+
+    def get_json_pattern(self):
+        """
+        regex as an ECMA-262 pattern, None when it can't be written as one
+        """
+        if self.json_pattern is not None:
+            return self.json_pattern
+        compiled = self.regex_validator.pattern
+        if compiled.flags & PYTHON_ONLY_FLAGS or PYTHON_ONLY_REGEX.search(compiled.pattern):
+            return None
+        # Pattern is matched from the start of the text like re.match
+        pattern = compiled.pattern
+        return pattern if pattern.startswith('^') else '^' + pattern
+
+    def validate_specific_data_type(self, validating_value, index):
+        if self.transform is not None:
+            if self.convert_number:
+                validating_value = str(validating_value)
+            if type(validating_value) is str:
+                validating_value = self.transform(validating_value)
+        return super(RegexField, self).validate_specific_data_type(validating_value, index)
+
+
+class EmailField(RegexField):
+    field_type = 'email'
+    regex = EmailValidator.email_pattern
+
+    def __init__(self, verbose_name, max_length=254, transform=None, error_message=None, **kwargs):
+        super(EmailField, self).__init__(
+            max_length, verbose_name, transform=transform, error_message=error_message, **kwargs
+        )
+
+    def get_regex_validator(self, regex, message, flags):
+        return EmailValidator(message=message)
+
+    def get_json_schema(self):
+        schema = super(EmailField, self).get_json_schema()
+        schema['format'] = 'email'
+        return schema
+
+
+class SlugField(RegexField):
+    field_type = 'slug'
+    regex = r'[-a-zA-Z0-9_]+\Z'
+    json_pattern = '^[-a-zA-Z0-9_]+$'
+    error_message = gettext_noop('"%(value)s" can only contain letters, numbers, underscores or hyphens.')
+
+    def __init__(self, verbose_name, max_length=50, transform=None, error_message=None, **kwargs):
+        super(SlugField, self).__init__(
+            max_length, verbose_name, transform=transform, error_message=error_message, **kwargs
+        )
+
 
 class IntegerField(DigitBaseField):
+    field_type = 'integer'
 
     def validate_specific_data_type(self, validating_value, index):
         try:
@@ -210,8 +552,22 @@ class IntegerField(DigitBaseField):
 
         return validating_value
 
+    def get_spec(self):
+        spec = super(IntegerField, self).get_spec()
+        spec['choices'] = list(self.choices) if self.choices else None
+        return spec
+
+    def get_json_schema(self):
+        schema = super(IntegerField, self).get_json_schema()
+        schema['type'] = 'integer'
+        if self.choices:
+            schema['enum'] = list(self.choices)
+        return schema
+
 
 class DateField(BaseDateTimeField):
+    field_type = 'date'
+    json_format = 'date'
 
     def validate_specific_data_type(self, validating_value, index):
         validating_value = self.convert_int_to_str(validating_value)
@@ -223,6 +579,8 @@ class DateField(BaseDateTimeField):
 
 
 class DateTimeField(BaseDateTimeField):
+    field_type = 'datetime'
+    json_format = 'date-time'
 
     def validate_specific_data_type(self, validating_value, index):
         validating_value = self.convert_int_to_str(validating_value)
@@ -231,3 +589,106 @@ class DateTimeField(BaseDateTimeField):
 
         validating_value = self.convert_datetime(validating_value, index)
         return validating_value if validating_value is not None else validating_value
+
+
+class DecimalField(BaseNumberField):
+    field_type = 'decimal'
+
+    def __init__(self, verbose_name, max_digits=None, decimal_places=None, blank=False, default=None,
+                 min_value=None, max_value=None, decimal_separator='.', rounding=decimal.ROUND_HALF_UP,
+                 validators=None, cache=False):
+        super(DecimalField, self).__init__(
+            verbose_name, blank, default, min_value, max_value, decimal_separator, validators, cache
+        )
+        self.max_digits = max_digits
+        self.decimal_places = decimal_places
+        self.rounding = rounding
+        self._quantum = None
+        if decimal_places is not None:
+            self._quantum = decimal.Decimal(1).scaleb(-decimal_places)
+
+    def validate_specific_data_type(self, validating_value, index):
+        value_type = type(validating_value)
+        try:
+            if value_type is decimal.Decimal:
+                value = self._quantize(validating_value)
+            elif value_type is float:
+                # repr gives the shortest text of the float, e.g. 0.1 not 0.1000000000000000055
+                value = self._text_to_decimal(repr(validating_value))
+            elif value_type is int:
+                value = self._text_to_decimal(str(validating_value))
+            elif isinstance(validating_value, str):
+                value = self._text_to_decimal(self.normalize_number(validating_value, index))
+            else:
+                raise self._number_error(validating_value, index)
+            if not value.is_finite():
+                raise self._number_error(validating_value, index)
+        except decimal.InvalidOperation:
+            raise self._number_error(validating_value, index)
+
+        if self.max_digits is not None:
+            value_tuple = value.as_tuple()
+            digits = len(value_tuple.digits)
+            if value_tuple.exponent > 0:
+                digits += value_tuple.exponent
+            else:
+                digits = max(digits, -value_tuple.exponent)
+            if digits > self.max_digits:
+                msg = _('cannot be more than %(max_digits)s digits.') % {'max_digits': self.max_digits}
+                raise ValidationError(message=error_trans(index, self.verbose_name, msg))
+
+        return value
+
+    def _text_to_decimal(self, text):
+        """
+        Decimal of a number text. Up to decimal_places digits after the point
+        are padded with zeros, which is cheaper than quantize.
+        """
+        places = self.decimal_places
+        if places is None or 'e' in text or 'E' in text:
+            return self._quantize(decimal.Decimal(text))
+        point = text.find('.')
+        text_places = 0 if point == -1 else len(text) - point - 1
+        if text_places > places:
+            return self._quantize(decimal.Decimal(text))
+        if text_places < places:
+            text += ('.' if point == -1 else '') + '0' * (places - text_places)
+        # Longer texts may have more digits than quantize allows
+        if len(text) > DECIMAL_PAD_MAX_LENGTH:
+            return self._quantize(decimal.Decimal(text))
+        return decimal.Decimal(text)
+
+    def _quantize(self, value):
+        # Values with more digits than the context precision, e.g. 1e30
+        # with 2 decimal places, cannot be quantized
+        if self._quantum is not None and value.is_finite():
+            value = value.quantize(self._quantum, rounding=self.rounding)
+        return value
+
+    def get_spec(self):
+        spec = super(DecimalField, self).get_spec()
+        spec.update(max_digits=self.max_digits, decimal_places=self.decimal_places)
+        return spec
+
+
+class FloatField(BaseNumberField):
+    field_type = 'float'
+
+    def validate_specific_data_type(self, validating_value, index):
+        value_type = type(validating_value)
+        try:
+            if value_type is float:
+                value = validating_value
+            elif value_type is int or value_type is decimal.Decimal:
+                value = float(validating_value)
+            elif isinstance(validating_value, str):
+                value = float(self.normalize_number(validating_value, index))
+            else:
+                raise self._number_error(validating_value, index)
+        except ValueError:
+            raise self._number_error(validating_value, index)
+
+        if not math.isfinite(value):
+            raise self._number_error(validating_value, index)
+
+        return value
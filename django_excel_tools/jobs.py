@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import logging
+import threading
+
+from django_excel_tools import exceptions
+from django_excel_tools.quarantine import CallbackQuarantine, ListQuarantine
+
+log = logging.getLogger(__name__)
+
+
+class Checkpoint(object):
+    RUNNING = 'running'
+    INVALID = 'invalid'
+    FAILED = 'failed'
+    FINISHED = 'finished'
+
+    def __init__(self, job_id, status=RUNNING, last_row=None, imported_rows=0, error_count=0):
+        self.job_id = job_id
+        self.status = status
+        # Row index of the last row of the last committed chunk
+        self.last_row = last_row
+        self.imported_rows = imported_rows
+        self.error_count = error_count
+
+    def __repr__(self):
+        return '<Checkpoint- {} {} row {}>'.format(self.job_id, self.status, self.last_row)
+
+
+class BaseCheckpointStore(object):
+
+    def load(self, job_id):
+        """
+        :return: Checkpoint of job_id or None when the job never started
+        """
+        raise NotImplementedError
+
+    def save(self, checkpoint):
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(BaseCheckpointStore):
+
+    def __init__(self):
+        self.checkpoints = {}
+
+    def load(self, job_id):
+        checkpoint = self.checkpoints.get(job_id)
+        if checkpoint is None:
+            return None
+        return Checkpoint(**checkpoint)
+
+    def save(self, checkpoint):
+        self.checkpoints[checkpoint.job_id] = dict(vars(checkpoint))
+
+
+class ModelCheckpointStore(BaseCheckpointStore):
+    """
+    Store checkpoints in `django_excel_tools.models.ImportCheckpoint`, requires
+    django_excel_tools in INSTALLED_APPS. The checkpoint is saved inside the
+    chunk transaction, so an imported chunk and its checkpoint are committed
+    together.
+    """
+
+    def __init__(self, using=None):
+        self.using = using
+
+    @property
+    def model(self):
+        from django_excel_tools.models import ImportCheckpoint
+        return ImportCheckpoint
+
+    def load(self, job_id):
+        try:
+            instance = self.model.objects.using(self.using).get(job_id=job_id)
+        except self.model.DoesNotExist:
+            return None
+        return Checkpoint(
+            job_id=instance.job_id,
+            status=instance.status,
+            last_row=instance.last_row,
+            imported_rows=instance.imported_rows,
+            error_count=instance.error_count
+        )
+
+    def save(self, checkpoint):
+        self.model.objects.using(self.using).update_or_create(
+            job_id=checkpoint.job_id,
+            defaults={
+                'status': checkpoint.status,
+                'last_row': checkpoint.last_row,
+                'imported_rows': checkpoint.imported_rows,
+                'error_count': checkpoint.error_count,
+            }
+        )
+
+
+class ImportJob(object):
+    """
+    Run a serializer over the worksheet chunk by chunk. Each chunk is imported
+    by `import_operation` in its own transaction and the checkpoint is saved
+    after it, so running the same job again resumes after the last committed
+    row instead of importing from the first row.
+
+    The job stops before importing a chunk that has validation errors, rows of
+    earlier chunks stay imported. Rules over the whole sheet, Meta.aggregates
+    and Meta.max_rows, and unique checks of a resumed job are validated in a
+    pass over every row before the first chunk is imported.
+
+    With Meta.partial_import invalid rows of a chunk are written to the
+    quarantine sink inside the chunk transaction, a resumed job doesn't
+    quarantine them twice.
+
+    `lock` is held while a chunk is imported only, so jobs sharing a lock
+    validate their rows concurrently. `max_errors` stops reading rows after
+    this many row errors.
+    """
+
+    def __init__(self, serializer_class, worksheet, job_id, store=None, chunk_size=None, using=None, lock=None,
+                 max_errors=None, **kwargs):
+        self.serializer_class = serializer_class
+        self.worksheet = worksheet
+        self.job_id = job_id
+        self.store = store if store is not None else ModelCheckpointStore(using=using)
+        self.chunk_size = chunk_size
+        self.using = using
+        self.lock = lock
+        self.max_errors = max_errors
+        self.kwargs = kwargs
+        self.serializer = None
+        self.checkpoint = None
+        self.failed = False
+        self.raw_rows = None
+        # Quarantine sink of the serializer, rows of a chunk are buffered until
+        # the chunk is committed
+        self.quarantine = None
+
+    def run(self):
+        serializer = self.serializer_class.prepare(self.worksheet, **self.kwargs)
+        self.serializer = serializer
+        chunk_size = self.chunk_size or serializer.meta.chunk_size
+
+        checkpoint = self.store.load(self.job_id) or Checkpoint(self.job_id)
+        self.checkpoint = checkpoint
+        if checkpoint.status == Checkpoint.FINISHED:
+            return checkpoint
+
+        if serializer.validation_errors:
+            return self._finish(Checkpoint.INVALID)
+
+        if checkpoint.last_row is None:
+            start_index = serializer.start_index
+        else:
+            start_index = checkpoint.last_row + 1
+            serializer.committed_row = checkpoint.last_row
+            log.info('Resume import job %s from row %s', self.job_id, start_index + 1)
+
+        if self._needs_validation_pass() and not self._validate_sheet():
+            return self._finish(Checkpoint.INVALID)
+
+        self.quarantine = serializer.quarantine
+        if self.quarantine is not None:
+            serializer.quarantine = ListQuarantine()
+
+        chunk = []
+        # Cell values of the rows of the chunk, kept for quarantine only
+        self.raw_rows = {} if serializer.quarantine is not None else None
+        last_row = None
+        for row_index, row in serializer._iter_rows(start_index):
+            last_row = row_index
+            errors, cleaned_row = serializer._serialize_row(row_index, row)
+            if not errors:
+                chunk.append((row_index, cleaned_row))
+                if self.raw_rows is not None:
+                    self.raw_rows[row_index] = row
+            elif serializer.quarantine is not None:
+                serializer._quarantine_row(row_index, row, errors)
+            else:
+                serializer.validation_errors.extend(errors)
+                if self.max_errors is not None and len(serializer.validation_errors) >= self.max_errors:
+                    break
+
+            if row_index - start_index + 1 < chunk_size:
+                continue
+            if not self._flush(chunk, row_index):
+                break
+            chunk = []
+            start_index = row_index + 1
+        else:
+            if last_row is not None and last_row >= start_index:
+                self._flush(chunk, last_row)
+
+        if self.quarantine is not None:
+            # Rows of a chunk that was not committed are not kept
+            serializer.quarantine = self.quarantine
+            self.quarantine.close()
+
+        if serializer.validation_errors:
+            return self._finish(Checkpoint.INVALID)
+        if self.failed or serializer.operation_errors:
+            return self._finish(Checkpoint.FAILED)
+        return self._finish(Checkpoint.FINISHED)
+
+    def _needs_validation_pass(self):
+        """
+        Aggregates and max_rows are only known after the last row, and rows
+        before the resume point are needed for unique checks
+        """
+        meta = self.serializer.meta
+        if meta.aggregates or meta.max_rows is not None:
+            return True
+        return bool(meta.unique_checks) and self.checkpoint.last_row is not None
+
+    def _validate_sheet(self):
+        """
+        Validate every row without importing, cleaned rows are not kept. Rows
+        committed before the resume point are not checked against the
+        database again, they keep their values in the unique indexes.
+        :return: True when the sheet is valid
+        """
+        serializer = self.serializer
+        quarantine = serializer.quarantine
+        if quarantine is not None:
+            # Invalid rows are quarantined by the import pass
+            serializer.quarantine = CallbackQuarantine(lambda row, values, errors: None)
+        errors, _cleaned_data = serializer._proceed_serialize_excel_data(self.max_errors, keep_rows=False)
+        serializer.validation_errors.extend(errors)
+        serializer.quarantine = quarantine
+        if serializer.validation_errors:
+            return False
+
+        # The import pass validates the rows again from the resume point
+        serializer.error_records = []
+        serializer.quarantined_rows = 0
+        # Committed rows stay indexed, index values are row numbers (row index + 1)
+        last_row = self.checkpoint.last_row
+        last_number = 0 if last_row is None else last_row + 1
+        serializer.unique_indexes = dict(
+            (names, dict((key, number) for key, number in index.items() if number <= last_number))
+            for names, index in serializer.unique_indexes.items()
+        )
+        serializer.aggregate_values = [{} for _aggregate in serializer.meta.aggregates]
+        return True
+
+    def _flush(self, chunk, last_row):
+        """
+        Validate the chunk in batch and import it when the job has no errors
+        :return: True when the chunk is committed
+        """
+        serializer = self.serializer
+        errors, cleaned_rows = serializer._serialize_chunk(chunk, self.raw_rows)
+        if self.raw_rows is not None:
+            self.raw_rows.clear()
+        serializer.validation_errors.extend(errors)
+        if serializer.validation_errors:
+            return False
+        if self.lock is None:
+            return self._commit(cleaned_rows, last_row)
+        with self.lock:
+            return self._commit(cleaned_rows, last_row)
+
+    def _commit(self, chunk, last_row):
+        from django.db import transaction
+
+        serializer = self.serializer
+        checkpoint = self.checkpoint
+        with transaction.atomic(using=self.using):
+            try:
+                serializer.import_operation(chunk)
+                failed = False
+            except exceptions.ImportOperationFailed:
+                failed = True
+            if failed or serializer.operation_errors:
+                transaction.set_rollback(True, using=self.using)
+                self.failed = True
+                return False
+
+            if self.quarantine is not None:
+                for row, values, errors in serializer.quarantine.rows:
+                    self.quarantine.add(row, values, errors)
+                self.quarantine.flush()
+                serializer.quarantine.rows = []
+
+            checkpoint.last_row = last_row
+            checkpoint.imported_rows += len(chunk)
+            self.store.save(checkpoint)
+        return True
+
+    def _finish(self, status):
+        serializer = self.serializer
+        checkpoint = self.checkpoint
+        checkpoint.status = status
+        checkpoint.error_count = (
+            len(serializer.validation_errors) + len(serializer.operation_errors) + serializer.quarantined_rows
+        )
+        self.store.save(checkpoint)
+
+        if status == Checkpoint.INVALID:
+            serializer.invalid(serializer.validation_errors)
+        elif status == Checkpoint.FAILED:
+            serializer.operation_failed(serializer.operation_errors)
+        else:
+            serializer.operation_success()
+        return checkpoint
+
+
+def run_in_thread(job, daemon=True):
+    """
+    Run the job in a plain thread, database connections opened by the thread
+    are closed when the job ends.
+    :return: started thread
+    """
+    def target():
+        from django.db import connections
+        try:
+            job.run()
+        finally:
+            connections.close_all()
+
+    thread = threading.Thread(target=target, name='import-job-{}'.format(job.job_id))
+    thread.daemon = daemon
+    thread.start()
+    return thread
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand, CommandError
+
+from django_excel_tools.batches import FileReport, run_batch
+
+
+class Command(BaseCommand):
+    help = 'Import every file of a directory or glob with the same serializer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('serializer', help='Dotted path of the serializer class.')
+        parser.add_argument('source', help='Directory or glob of the files.')
+        parser.add_argument('--pattern', default='*.xlsx', help='File pattern when source is a directory.')
+        parser.add_argument('--sheet', default=None, help='Sheet name, default is the first sheet.')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Worker processes validating files, default is the number of CPUs.')
+        parser.add_argument('--import-workers', type=int, default=1,
+                            help='Files imported at the same time.')
+        parser.add_argument('--dry-run', action='store_true', help='Validate files without importing them.')
+
+    def handle(self, *args, **options):
+        report = run_batch(
+            options['serializer'],
+            options['source'],
+            workers=options['workers'],
+            import_workers=options['import_workers'],
+            pattern=options['pattern'],
+            sheet_name=options['sheet'],
+            dry_run=options['dry_run']
+        )
+        if not report.files:
+            raise CommandError('No file found in {}.'.format(options['source']))
+
+        self.stdout.write(report.as_table())
+        for file_report in report.files:
+            for error in file_report.errors:
+                self.stderr.write('{}: {}'.format(file_report.path, error))
+        if not report.is_success:
+            succeeded = report.count(FileReport.VALID) + report.count(FileReport.IMPORTED)
+            raise CommandError('{} of {} files were not imported.'.format(
+                len(report.files) - succeeded, len(report.files)
+            ))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import cProfile
+import io
+import pstats
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_excel_tools.batches import FileReport, run_batch
+
+
+class Command(BaseCommand):
+    help = 'Validate and import excel files with a serializer, outside of a web request.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('serializer', help='Dotted path of the serializer class.')
+        parser.add_argument('files', nargs='+', help='Excel files to import.')
+        parser.add_argument('--sheet', default=None, help='Sheet name, default is the first sheet.')
+        parser.add_argument('--chunk-size', type=int, default=None,
+                            help='Import in chunks of this many rows, each in its own transaction.')
+        parser.add_argument('--dry-run', action='store_true', help='Validate without importing.')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Worker processes when several files are given.')
+        parser.add_argument('--max-errors', type=int, default=None,
+                            help='Stop validating a file after this many errors.')
+        parser.add_argument('--profile', nargs='?', const='', default=None, metavar='FILE',
+                            help='Profile the import with cProfile, stats are written to FILE '
+                                 'or the slowest functions are printed.')
+
+    def handle(self, *args, **options):
+        profile = options['profile']
+        if profile is not None and options['workers'] > 1:
+            raise CommandError('--profile can only be used with --workers 1.')
+
+        profiler = cProfile.Profile() if profile is not None else None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            report = run_batch(
+                options['serializer'],
+                options['files'],
+                workers=options['workers'],
+                sheet_name=options['sheet'],
+                dry_run=options['dry_run'],
+                chunk_size=options['chunk_size'],
+                max_errors=options['max_errors']
+            )
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+        self.stdout.write(report.as_table())
+        if profiler is not None:
+            self.write_profile(profiler, profile)
+
+        for file_report in report.files:
+            for error in file_report.errors[:options['max_errors']]:
+                self.stderr.write('{}: {}'.format(file_report.path, error))
+        if not report.is_success:
+            succeeded = report.count(FileReport.VALID) + report.count(FileReport.IMPORTED)
+            raise CommandError('{} of {} files were not imported.'.format(
+                len(report.files) - succeeded, len(report.files)
+            ))
+
+    def write_profile(self, profiler, path):
+        if path:
+            profiler.dump_stats(path)
+            self.stdout.write('Profile is written to {}.'.format(path))
+            return
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(30)
+        self.stdout.write(stream.getvalue())
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from django.db import models
+
+
+class ImportCheckpoint(models.Model):
+    """
+    Progress of a chunked import job, saved in the same transaction as each
+    imported chunk. Used by `django_excel_tools.jobs.ModelCheckpointStore`.
+    """
+    job_id = models.CharField(max_length=255, unique=True)
+    status = models.CharField(max_length=20)
+    last_row = models.IntegerField(null=True, blank=True)
+    imported_rows = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return '{} ({})'.format(self.job_id, self.status)
+
+
+class QuarantinedRow(models.Model):
+    """
+    Invalid row of a partial import kept for reprocessing, raw cell values and
+    errors are stored as JSON. Used by `django_excel_tools.quarantine.ModelQuarantine`.
+    """
+    source = models.CharField(max_length=255, db_index=True)
+    row = models.IntegerField()
+    values = models.TextField()
+    errors = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return '{} row {}'.format(self.source, self.row)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import sys
+import time
+from itertools import islice
+
+
+class ImportPreview(object):
+    """
+    Result of validating a sample of the worksheet. Projected numbers are
+    the sample rates applied to `estimated_rows`, they are exact when
+    `complete` is True.
+    """
+
+    def __init__(self, serializer, template_errors, estimated_rows=None, complete=False, validated_rows=0,
+                 invalid_rows=0, errors=None, seconds_per_row=0.0, cleaned_bytes=0):
+        self.serializer = serializer
+        # Errors of the worksheet itself, e.g. missing columns
+        self.template_errors = template_errors
+        # Data rows of the worksheet, rows after the head are estimated from
+        # the share of non-blank sampled rows unless complete
+        self.estimated_rows = estimated_rows
+        # True when every data row was validated
+        self.complete = complete
+        self.validated_rows = validated_rows
+        self.invalid_rows = invalid_rows
+        self.errors = errors if errors is not None else list(template_errors)
+        # Reading and validating one row, measured on the sampled rows
+        self.seconds_per_row = seconds_per_row
+        # Size of the cleaned rows of the sample
+        self.cleaned_bytes = cleaned_bytes
+
+    @property
+    def is_valid_template(self):
+        return not self.template_errors
+
+    @property
+    def error_rate(self):
+        if not self.validated_rows:
+            return 0.0
+        return self.invalid_rows / float(self.validated_rows)
+
+    def _project(self, value):
+        if self.complete or self.estimated_rows is None or not self.validated_rows:
+            return value
+        return int(round(value * self.estimated_rows / float(self.validated_rows)))
+
+    @property
+    def projected_invalid_rows(self):
+        return self._project(self.invalid_rows)
+
+    @property
+    def projected_errors(self):
+        return self._project(len(self.errors))
+
+    @property
+    def estimated_seconds(self):
+        """
+        Validation time of the whole worksheet, import_operation excluded
+        """
+        if self.estimated_rows is None:
+            return None
+        return self.seconds_per_row * self.estimated_rows
+
+    @property
+    def estimated_memory(self):
+        """
+        Bytes of cleaned_data for the whole worksheet
+        """
+        if self.estimated_rows is None or not self.validated_rows:
+            return None
+        return int(self.cleaned_bytes / float(self.validated_rows) * self.estimated_rows)
+
+    def __repr__(self):
+        return '<ImportPreview- {} of {} rows, {} errors>'.format(
+            self.validated_rows, self.estimated_rows, len(self.errors)
+        )
+
+
+def _row_size(cleaned_row):
+    values = cleaned_row.values() if isinstance(cleaned_row, dict) else cleaned_row
+    return sys.getsizeof(cleaned_row) + sum(sys.getsizeof(value) for value in values)
+
+
+def _has_random_access(worksheet):
+    # Read-only worksheets parse the sheet from the start on every iter_rows
+    return hasattr(worksheet, '_cells')
+
+
+def _iter_sample_rows(worksheet, row_indexes, max_col):
+    """
+    Yield (row_index, values) of the sorted row indexes, in one pass over the
+    sheet for read-only worksheets
+    """
+    if not row_indexes:
+        return
+    if _has_random_access(worksheet):
+        for row_index in row_indexes:
+            for values in worksheet.iter_rows(
+                min_row=row_index + 1, max_row=row_index + 1, max_col=max_col, values_only=True
+            ):
+                yield row_index, values
+        return
+
+    wanted = set(row_indexes)
+    rows = worksheet.iter_rows(
+        min_row=row_indexes[0] + 1, max_row=row_indexes[-1] + 1, max_col=max_col, values_only=True
+    )
+    for row_index, values in enumerate(rows, start=row_indexes[0]):
+        if row_index in wanted:
+            yield row_index, values
+
+
+def preview(serializer_class, worksheet, head=100, sample=100, seed=None, **kwargs):
+    """
+    Validate the first `head` data rows and `sample` random rows after them
+    and project errors, time and memory of the whole worksheet.
+    import_operation is never called.
+    """
+    serializer = serializer_class.prepare(worksheet, **kwargs)
+    template_errors = list(serializer.validation_errors)
+    if template_errors:
+        return ImportPreview(serializer, template_errors)
+
+    # Sampled rows of read-only worksheets are read in a pass over the sheet,
+    # so reading cost is measured on the head rows only
+    started = time.perf_counter()
+    rows = serializer._iter_rows()
+    head_rows = list(islice(rows, head))
+    read_seconds = time.perf_counter() - started
+    last_head_index = head_rows[-1][0] if head_rows else serializer.start_index - 1
+    complete = next(rows, None) is None
+    rows.close()
+
+    sample_rows = []
+    max_row = worksheet.max_row
+    population = range(last_head_index + 1, max_row if max_row is not None else 0)
+    # Share of non-blank rows after the head, formatted but empty rows at
+    # the end of the sheet are counted in max_row
+    data_share = 1.0
+    if not complete and population and sample:
+        row_indexes = sorted(random.Random(seed).sample(population, min(sample, len(population))))
+        sample_rows = [
+            (row_index, values)
+            for row_index, values in _iter_sample_rows(worksheet, row_indexes, len(serializer.fields))
+            if not serializer._is_blank_row(values)
+        ]
+        data_share = len(sample_rows) / float(len(row_indexes))
+
+    started = time.perf_counter()
+    errors = list(serializer.validation_errors)
+    invalid_rows = 0
+    chunk = []
+    for row_index, values in head_rows + sample_rows:
+        row_errors, cleaned_row = serializer._serialize_row(row_index, values)
+        if row_errors:
+            errors.extend(row_errors)
+            invalid_rows += 1
+        else:
+            chunk.append((row_index, cleaned_row))
+    chunk_errors, cleaned_rows = serializer._serialize_chunk(chunk)
+    errors.extend(chunk_errors)
+    invalid_rows += len(chunk) - len(cleaned_rows)
+    validate_seconds = time.perf_counter() - started
+
+    validated_rows = len(head_rows) + len(sample_rows)
+    seconds_per_row = 0.0
+    if validated_rows:
+        seconds_per_row = validate_seconds / validated_rows
+    if head_rows:
+        seconds_per_row += read_seconds / len(head_rows)
+    if complete:
+        estimated_rows = validated_rows
+    elif max_row is not None:
+        estimated_rows = max(len(head_rows) + int(round(len(population) * data_share)), validated_rows)
+    else:
+        estimated_rows = None
+
+    cleaned_bytes = sum(_row_size(cleaned_row) for cleaned_row in cleaned_rows)
+    return ImportPreview(
+        serializer,
+        template_errors,
+        estimated_rows=estimated_rows,
+        complete=complete,
+        validated_rows=validated_rows,
+        invalid_rows=invalid_rows,
+        errors=errors,
+        seconds_per_row=seconds_per_row,
+        cleaned_bytes=cleaned_bytes
+    )
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Sinks of invalid rows for `Meta.partial_import`. A sink receives the sheet
+row number, the raw cell values and the error messages of every invalid row
+together with the import of the valid rows, `close` is called once the
+worksheet is imported.
+"""
+import csv
+import json
+
+
+class BaseQuarantine(object):
+
+    def add(self, row, values, errors):
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        Write buffered rows, called inside the import transaction
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class ListQuarantine(BaseQuarantine):
+    """
+    Keep invalid rows in memory as (row, values, errors), the default sink
+    """
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, row, values, errors):
+        self.rows.append((row, tuple(values), list(errors)))
+
+
+class CallbackQuarantine(BaseQuarantine):
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def add(self, row, values, errors):
+        self.callback(row, values, errors)
+
+
+class CSVQuarantine(BaseQuarantine):
+    """
+    Write invalid rows to a CSV file with the row number, the cell values and
+    the errors joined by new lines. The file is opened with the first row.
+    :param header: column names written before the first row
+    """
+
+    def __init__(self, path_or_file, header=None, encoding='utf-8'):
+        self.path_or_file = path_or_file
+        self.header = header
+        self.encoding = encoding
+        self.fileobj = None
+        self.writer = None
+
+    def _open(self):
+        if isinstance(self.path_or_file, str):
+            self.fileobj = open(self.path_or_file, 'w', newline='', encoding=self.encoding)
+        else:
+            self.fileobj = self.path_or_file
+        self.writer = csv.writer(self.fileobj)
+        if self.header is not None:
+            self.writer.writerow(['row'] + list(self.header) + ['errors'])
+
+    def add(self, row, values, errors):
+        if self.writer is None:
+            self._open()
+        self.writer.writerow([row] + list(values) + ['\n'.join(errors)])
+
+    def flush(self):
+        if self.fileobj is not None:
+            self.fileobj.flush()
+
+    def close(self):
+        if self.fileobj is not None and isinstance(self.path_or_file, str):
+            self.fileobj.close()
+        self.fileobj = None
+        self.writer = None
+
+
+class ModelQuarantine(BaseQuarantine):
+    """
+    Save invalid rows as `django_excel_tools.models.QuarantinedRow` in batches
+    of batch_size, requires django_excel_tools in INSTALLED_APPS.
+    :param source: name of the imported file or feed, e.g. the job id
+    """
+
+    def __init__(self, source, using=None, batch_size=500):
+        self.source = source
+        self.using = using
+        self.batch_size = batch_size
+        self.pending = []
+
+    def add(self, row, values, errors):
+        from django_excel_tools.models import QuarantinedRow
+
+        self.pending.append(QuarantinedRow(
+            source=self.source,
+            row=row,
+            values=json.dumps(list(values), default=str),
+            errors=json.dumps(list(errors))
+        ))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        from django_excel_tools.models import QuarantinedRow
+
+        QuarantinedRow.objects.using(self.using).bulk_create(self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import csv
+import io
+import tempfile
+
+from django_excel_tools.exporters import export_workbook, get_header_rows, iter_export_rows
+
+CSV_CONTENT_TYPE = 'text/csv'
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Size of each chunk handed to the WSGI server
+STREAM_CHUNK_SIZE = 64 * 1024
+# xlsx smaller than this stays in memory, bigger one is rolled over to disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def iter_csv(serializer_class, queryset, chunk_size=2000, encoding='utf-8'):
+    """
+    Yield encoded CSV chunks while rows are produced from the queryset.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in get_header_rows(serializer_class):
+        writer.writerow(row)
+
+    for row in iter_export_rows(serializer_class, queryset, chunk_size):
+        writer.writerow(row)
+        if buffer.tell() >= STREAM_CHUNK_SIZE:
+            yield buffer.getvalue().encode(encoding)
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode(encoding)
+
+
+def iter_xlsx(serializer_class, queryset, chunk_size=2000, spool_max_size=SPOOL_MAX_SIZE):
+    """
+    Write the workbook into a spooled temporary file and yield it in chunks.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=spool_max_size) as fileobj:
+        export_workbook(serializer_class, queryset, fileobj, chunk_size=chunk_size)
+        fileobj.seek(0)
+        while True:
+            data = fileobj.read(STREAM_CHUNK_SIZE)
+            if not data:
+                break
+            yield data
+
+
+def export_response(serializer_class, queryset, filename, file_format='xlsx', chunk_size=2000):
+    """
+    StreamingHttpResponse of queryset exported with serializer_class fields.
+    :param file_format: 'xlsx' or 'csv'
+    """
+    from django.http import StreamingHttpResponse
+
+    if file_format == 'csv':
+        content = iter_csv(serializer_class, queryset, chunk_size)
+        content_type = CSV_CONTENT_TYPE
+    elif file_format == 'xlsx':
+        content = iter_xlsx(serializer_class, queryset, chunk_size)
+        content_type = XLSX_CONTENT_TYPE
+    else:
+        raise ValueError('file_format must be "xlsx" or "csv".')
+
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
+    return response
@@ -1,31 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import logging
-import sys
 from collections import OrderedDict
+from functools import reduce
 
 from django_excel_tools import exceptions
+from django_excel_tools.quarantine import ListQuarantine
 from django_excel_tools.fields import (
     BooleanField, CharField, IntegerField, DateField,
-    DateTimeField
+    DateTimeField, DecimalField, FloatField, RegexField,
+    EmailField, SlugField
+)
+from django_excel_tools.utils import (
+    _, ErrorRecord, error_trans, header_fingerprint, make_row_class, normalize_header
 )
-from django_excel_tools.utils import error_trans
-
-try:
-    import django
 
-    major, feature, minor, a, b = django.VERSION
-    if major >= 2:
-        from django.utils.translation import gettext as _
-    else:
-        from django.utils.translation import ugettext as _
-except ImportError:
-    raise exceptions.SerializerConfigError(
-        'Django is required. Please make sure you have install via pip.'
-    )
+log = logging.getLogger(__name__)
 
+ROW_TYPES = ('dict', 'record', 'tuple')
 
-log = logging.getLogger(__name__)
+UNIQUE_QUERY_BATCH_SIZE = 200
 
 
 class SerializerMeta:
@@ -47,32 +41,133 @@ class SerializerMeta:
             assert type(meta.enable_transaction) in [None, bool], 'Type must be bool.'
         self.enable_transaction = getattr(meta, 'enable_transaction', True)
 
+        if hasattr(meta, 'chunk_size'):
+            assert type(meta.chunk_size) is int, 'Meta.chunk_size must be int.'
+            assert meta.chunk_size > 0, 'Meta.chunk_size must be greater than 0.'
+        self.chunk_size = getattr(meta, 'chunk_size', 1000)
+
+        self.max_rows = getattr(meta, 'max_rows', None)
+        assert self.max_rows is None or type(self.max_rows) is int, 'Meta.max_rows must be int.'
+
+        self.stop_after_blank_rows = getattr(meta, 'stop_after_blank_rows', 1)
+        assert self.stop_after_blank_rows is None or type(self.stop_after_blank_rows) is int, \
+            'Meta.stop_after_blank_rows must be int or None.'
+
+        self.row_type = getattr(meta, 'row_type', 'dict')
+        assert self.row_type in ROW_TYPES, 'Meta.row_type must be one of {}.'.format(', '.join(ROW_TYPES))
+
+        unique_fields = getattr(meta, 'unique_fields', ())
+        assert type(unique_fields) in [list, tuple], 'Meta.unique_fields must be list or tuple.'
+        unique_together = getattr(meta, 'unique_together', ())
+        assert type(unique_together) in [list, tuple], 'Meta.unique_together must be list or tuple.'
+        # Every unique check as tuple of field names
+        self.unique_checks = [(name,) for name in unique_fields]
+        self.unique_checks += [tuple(names) for names in unique_together]
+        for names in self.unique_checks:
+            for name in names:
+                assert name in self.fields, '{} of unique check is not in Meta.fields.'.format(name)
+
+        self.partial_import = getattr(meta, 'partial_import', False)
+        assert type(self.partial_import) is bool, 'Meta.partial_import must be bool.'
+
+        self.aggregates = list(getattr(meta, 'aggregates', ()))
+        for aggregate in self.aggregates:
+            for name in (aggregate.field, aggregate.group_by):
+                assert name is None or name in self.fields, \
+                    '{} of Meta.aggregates is not in Meta.fields.'.format(name)
+
+        self.check_header = getattr(meta, 'check_header', False)
+        self.header_aliases = getattr(meta, 'header_aliases', {})
+        assert type(self.header_aliases) is dict, 'Meta.header_aliases must be dict.'
+        for name in self.header_aliases:
+            assert name in self.fields, '{} of Meta.header_aliases is not in Meta.fields.'.format(name)
+        self.header_fingerprint = getattr(meta, 'header_fingerprint', None)
+        self.header_index = getattr(meta, 'header_index', self.start_index - 1)
+        if self.check_header or self.header_fingerprint:
+            assert type(self.header_index) is int and 0 <= self.header_index < self.start_index, \
+                'Meta.header_index must be a row before Meta.start_index.'
+
 
 class BaseSerializer(object):
 
     def __init__(self, worksheet, **kwargs):
+        self._setup(worksheet, **kwargs)
+        self._validate_worksheet()
+
+        if self.validation_errors:
+            self.invalid(self.validation_errors)
+        else:
+            self.validated()
+            self._start_operation()
+
+    @classmethod
+    def prepare(cls, worksheet, **kwargs):
+        """
+        Create serializer without validating and importing the worksheet, rows
+        are processed by the caller, e.g. `django_excel_tools.jobs.ImportJob`.
+        """
+        serializer = cls.__new__(cls)
+        serializer._setup(worksheet, **kwargs)
+        return serializer
+
+    def _validate_worksheet(self, max_errors=None):
+        """
+        Validate all rows into cleaned_data without importing them
+        :param max_errors: stop reading rows after this many errors
+        """
+        quarantine = self.quarantine
+        if quarantine is not None and type(quarantine) is not ListQuarantine:
+            # Rows are written to the sink with the import, see _write_quarantine
+            self.quarantine_buffer = self.quarantine = ListQuarantine()
+        try:
+            if not self.validation_errors:
+                validation_errors, cleaned_data = self._proceed_serialize_excel_data(max_errors)
+                self.validation_errors.extend(validation_errors)
+                self.cleaned_data = cleaned_data
+        finally:
+            self.quarantine = quarantine
+        if self.validation_errors:
+            self._close_quarantine()
+
+    def _setup(self, worksheet, **kwargs):
         self.kwargs = kwargs
+        self.workbook = kwargs.get('workbook')
         self.meta = SerializerMeta(getattr(self, 'Meta', None))
 
         self.field_names = self.meta.fields
         self.start_index = self.meta.start_index
         self.class_fields = self._get_class_fields()
         self.fields = self._get_fields()
+        # Field name -> position in record and tuple rows
+        self.row_header = dict((name, index) for index, name in enumerate(self.field_names))
+        self.row_class = self.get_row_class()
+        # Field name -> bound extra_clean_<field> method
+        self.extra_cleaners = dict(
+            (name, getattr(self, 'extra_clean_{}'.format(name)))
+            for name in self.get_extra_clean_names()
+        )
 
         self.operation_errors = []
+        self.error_records = []
+        self.cleaned_data = []
+        # Unique check -> {value: row number where it was first seen}
+        self.unique_indexes = dict((names, {}) for names in self.meta.unique_checks)
+        # Row index of the last row imported before a resumed ImportJob, rows up
+        # to it are not checked against get_unique_queryset
+        self.committed_row = None
+        # Per aggregate, group -> [accumulated value, last row index of the group]
+        self.aggregate_values = [{} for _aggregate in self.meta.aggregates]
+        # Sink of invalid rows when Meta.partial_import is set
+        self.quarantine = self.get_quarantine() if self.meta.partial_import else None
+        # Rows quarantined while validating, kept until the import transaction
+        self.quarantine_buffer = None
+        self.quarantined_rows = 0
         self.worksheet = worksheet
+        # (source, sheet_name) of a serializer created by from_file
+        self.file_source = None
         self.validation_errors = self._validate_columns_less_than_fields()
-
-        if not self.validation_errors:
-            validation_errors, cleaned_data = self._proceed_serialize_excel_data()
-            self.validation_errors = validation_errors
-            self.cleaned_data = cleaned_data
-
-        if self.validation_errors:
-            self.invalid(self.validation_errors)
-        else:
-            self.validated()
-            self._start_operation()
+        if not self.validation_errors and (self.meta.check_header or self.meta.header_fingerprint):
+            self.validation_errors = self._validate_header()
 
     def _get_class_fields(self):
         """
@@ -92,112 +187,627 @@ class BaseSerializer(object):
         Assigning class object to dictionary
         :return:
         """
+        return self.get_declared_fields()
+
+    @classmethod
+    def get_declared_fields(cls):
+        """
+        Fields of Meta.fields in order, available without reading a worksheet
+        :return:
+        """
+        meta = SerializerMeta(getattr(cls, 'Meta', None))
         fields = OrderedDict()
-        for name in self.field_names:
+        for name in meta.fields:
             try:
-                fields[name] = getattr(self, name)
+                fields[name] = getattr(cls, name)
             except AttributeError:
                 message = '{} is not defined in class field'.format(name)
                 raise exceptions.FieldNotExist(message=message)
         return fields
 
+    @classmethod
+    def get_row_class(cls):
+        """
+        Record class of Meta.row_type 'record', created once per serializer
+        """
+        row_class = cls.__dict__.get('_row_class')
+        if row_class is None:
+            meta = SerializerMeta(getattr(cls, 'Meta', None))
+            row_class = make_row_class('{}Row'.format(cls.__name__), meta.fields)
+            cls._row_class = row_class
+        return row_class
+
+    @classmethod
+    def get_extra_clean_names(cls):
+        """
+        Field names that have a callable extra_clean_<field>, looked up once
+        per serializer instead of once per cell
+        """
+        names = cls.__dict__.get('_extra_clean_names')
+        if names is None:
+            meta = SerializerMeta(getattr(cls, 'Meta', None))
+            names = tuple(
+                name for name in meta.fields
+                if callable(getattr(cls, 'extra_clean_{}'.format(name), None))
+            )
+            cls._extra_clean_names = names
+        return names
+
+    @classmethod
+    def get_schema(cls):
+        """
+        Template rules of the serializer as a dict of JSON values, built once
+        per serializer class. The returned dict is shared, don't modify it.
+        """
+        schema = cls.__dict__.get('_schema')
+        if schema is None:
+            meta = SerializerMeta(getattr(cls, 'Meta', None))
+            fields = []
+            for name, field in cls.get_declared_fields().items():
+                spec = OrderedDict(name=name)
+                spec.update(field.get_spec())
+                fields.append(spec)
+            schema = {
+                'start_index': meta.start_index,
+                'max_rows': meta.max_rows,
+                'unique_checks': [list(names) for names in meta.unique_checks],
+                'fields': fields,
+            }
+            cls._schema = schema
+        return schema
+
+    @classmethod
+    def get_json_schema(cls):
+        """
+        JSON schema of the cleaned rows, built once per serializer class.
+        Properties are in the order of the columns.
+        """
+        json_schema = cls.__dict__.get('_json_schema')
+        if json_schema is None:
+            properties = OrderedDict()
+            required = []
+            for name, field in cls.get_declared_fields().items():
+                schema = field.get_json_schema()
+                if not field.blank:
+                    required.append(name)
+                elif 'type' in schema:
+                    schema['type'] = [schema['type'], 'null']
+                properties[name] = schema
+            json_schema = {
+                '$schema': 'http://json-schema.org/draft-07/schema#',
+                'title': cls.__name__,
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': properties,
+                    'required': required,
+                },
+            }
+            max_rows = SerializerMeta(getattr(cls, 'Meta', None)).max_rows
+            if max_rows is not None:
+                json_schema['maxItems'] = max_rows
+            cls._json_schema = json_schema
+        return json_schema
+
+    @classmethod
+    def from_file(cls, source, sheet_name=None, **kwargs):
+        """
+        Serialize a sheet of a Django UploadedFile, a path or a file object
+        opened in read-only mode without copying the upload. The workbook is
+        closed once the sheet is serialized, write_error_workbook opens the
+        source again.
+        See `django_excel_tools.uploads.opened_workbook`.
+        """
+        from django_excel_tools.uploads import get_worksheet, opened_workbook
+        with opened_workbook(source) as workbook:
+            serializer = cls(get_worksheet(workbook, sheet_name), **kwargs)
+        serializer.file_source = (source, sheet_name)
+        return serializer
+
+    @classmethod
+    def preview(cls, worksheet, head=100, sample=100, seed=None, **kwargs):
+        """
+        Validate a sample of the worksheet and estimate errors, time and
+        memory of the whole import without calling import_operation.
+        See `django_excel_tools.previews.preview`.
+        """
+        from django_excel_tools.previews import preview
+        return preview(cls, worksheet, head=head, sample=sample, seed=seed, **kwargs)
+
+    @classmethod
+    def export(cls, queryset, fileobj, chunk_size=2000, title=None):
+        """
+        Write queryset into fileobj as xlsx that can be imported back by
+        this serializer. See `django_excel_tools.exporters.export_workbook`.
+        """
+        from django_excel_tools.exporters import export_workbook
+        return export_workbook(cls, queryset, fileobj, chunk_size=chunk_size, title=title)
+
+    @classmethod
+    def build_template(cls, fileobj, sample_rows=None):
+        """
+        Write an empty xlsx template of this serializer into fileobj. Without
+        sample_rows the content is built once per class and reused.
+        See `django_excel_tools.exporters.build_template`.
+        """
+        from django_excel_tools.exporters import build_template, get_template_bytes
+        if sample_rows is not None:
+            return build_template(cls, fileobj, sample_rows=sample_rows)
+        fileobj.write(get_template_bytes(cls))
+        return fileobj
+
+    @classmethod
+    def export_response(cls, queryset, filename, file_format='xlsx', chunk_size=2000):
+        """
+        StreamingHttpResponse of exported queryset in xlsx or csv format.
+        See `django_excel_tools.responses.export_response`.
+        """
+        from django_excel_tools.responses import export_response
+        return export_response(cls, queryset, filename, file_format=file_format, chunk_size=chunk_size)
+
+    def write_error_workbook(self, fileobj):
+        """
+        Write a copy of the worksheet with invalid cells highlighted and error
+        messages attached as comments.
+        See `django_excel_tools.exporters.write_error_workbook`.
+        """
+        from django_excel_tools.exporters import write_error_workbook
+        if self.file_source is None:
+            return write_error_workbook(self.worksheet, self.error_records, fileobj)
+
+        # The workbook of from_file is closed, the sheet is read from the source again
+        from django_excel_tools.uploads import get_worksheet, opened_workbook
+        source, sheet_name = self.file_source
+        with opened_workbook(source) as workbook:
+            return write_error_workbook(get_worksheet(workbook, sheet_name), self.error_records, fileobj)
+
     def _validate_columns_less_than_fields(self):
+        # Read-only worksheets without dimension information report None
+        if self.worksheet.max_column is None:
+            return []
         if self.worksheet.max_column < len(self.fields):
             data = {
                 'required_num': len(self.fields),
                 'excel_num': self.worksheet.max_column
             }
-            return [_('This import required %(required_num)s columns but excel'
-                      ' only has %(excel_num)s columns.') % data]
+            message = _('This import required %(required_num)s columns but excel'
+                        ' only has %(excel_num)s columns.') % data
+            self.error_records.append(ErrorRecord(None, None, None, message))
+            return [message]
         return []
 
-    def _proceed_serialize_excel_data(self):
-        max_column = len(self.fields)
+    @classmethod
+    def get_header_fingerprint(cls):
+        """
+        Fingerprint of the verbose names, the value for Meta.header_fingerprint
+        of files exported or templated by this serializer
+        """
+        fields = cls.get_declared_fields()
+        return header_fingerprint(field.verbose_name for field in fields.values())
+
+    def _get_header_names(self):
+        """
+        Field name -> accepted normalized header texts, prepared once per class
+        """
+        cls = type(self)
+        header_names = cls.__dict__.get('_header_names')
+        if header_names is None:
+            header_names = {}
+            for name, field in self.fields.items():
+                names = [field.verbose_name] + list(self.meta.header_aliases.get(name, ()))
+                header_names[name] = frozenset(normalize_header(value) for value in names)
+            cls._header_names = header_names
+        return header_names
+
+    def _validate_header(self):
+        """
+        Compare the header row with verbose names, Meta.header_aliases and
+        Meta.header_fingerprint. Only the header row is read, a wrong file is
+        rejected before its data rows are parsed.
+        """
+        row_number = self.meta.header_index + 1
+        rows = self.worksheet.iter_rows(
+            min_row=row_number, max_row=row_number, max_col=len(self.fields), values_only=True
+        )
+        values = tuple(next(iter(rows), ()))
+        values += (None,) * (len(self.fields) - len(values))
+
+        if self.meta.header_fingerprint and header_fingerprint(values) == self.meta.header_fingerprint:
+            return []
+
+        errors = []
+        header_names = self._get_header_names()
+        for col_index, value in enumerate(values):
+            key = self.field_names[col_index]
+            if normalize_header(value) in header_names[key]:
+                continue
+            message = _('Column %(column)s must be "%(expected)s" but it is "%(value)s".') % {
+                'column': col_index + 1,
+                'expected': self.fields[key].verbose_name,
+                'value': '' if value is None else value
+            }
+            errors.append(message)
+            self.error_records.append(ErrorRecord(row_number, col_index + 1, key, message))
+
+        if not errors and self.meta.header_fingerprint and not self.meta.check_header:
+            message = _('This excel does not match the import template.')
+            errors.append(message)
+            self.error_records.append(ErrorRecord(row_number, None, None, message))
+        return errors
+
+    def _proceed_serialize_excel_data(self, max_errors=None, keep_rows=True):
+        """
+        :param keep_rows: False validates without keeping cleaned_data
+        """
         validation_errors = []
         cleaned_data = []
-        for row_index, row in enumerate(self.worksheet):
-            # Ignore row that not yet start data gathering
-            if row_index < self.start_index:
+        chunk = []
+        # Cell values of the rows of the chunk, kept for quarantine only
+        raw_rows = {} if self.quarantine is not None else None
+        for row_index, row in self._iter_rows():
+            errors, cleaned_row = self._serialize_row(row_index, row)
+            if errors:
+                if self.quarantine is not None:
+                    self._quarantine_row(row_index, row, errors)
+                    continue
+                validation_errors.extend(errors)
+                if max_errors is not None and len(validation_errors) >= max_errors:
+                    return validation_errors, cleaned_data
                 continue
-            if self._is_last_row(row, max_column):
-                break
-            cleaned_row = {}
 
-            for col_index, cell in enumerate(row):
-                if col_index >= max_column:
-                    continue
-                key = self.field_names[col_index]
-                field_object = self.fields[key]
-                field_object.value = cell.value
-                try:
-                    field_object.validate(index=row_index + 1)
-                except exceptions.ValidationError as error:
-                    validation_errors.append(error.message)
-                    field_object.reset()
-                    continue
+            chunk.append((row_index, cleaned_row))
+            if raw_rows is not None:
+                raw_rows[row_index] = row
+            if len(chunk) >= self.meta.chunk_size:
+                errors, cleaned_rows = self._serialize_chunk(chunk, raw_rows)
+                validation_errors.extend(errors)
+                if keep_rows:
+                    cleaned_data.extend(cleaned_rows)
+                chunk = []
+                if raw_rows is not None:
+                    raw_rows.clear()
 
-                try:
-                    extra_clean_value = self._extra_clean_validate(key)
-                    if extra_clean_value is not None:
-                        field_object.cleaned_value = extra_clean_value
-                except exceptions.ValidationError as error:
-                    message = _('[Row %(index)s] %(error)s') % {
-                        'index': row_index + 1,
-                        'error': error.message
-                    }
-                    validation_errors.append(message)
-                    field_object.reset()
-                    continue
+        if chunk:
+            errors, cleaned_rows = self._serialize_chunk(chunk, raw_rows)
+            validation_errors.extend(errors)
+            if keep_rows:
+                cleaned_data.extend(cleaned_rows)
 
-                cleaned_row[key] = field_object.cleaned_value
-                field_object.reset()
+        validation_errors.extend(self._validate_aggregates())
+        return validation_errors, cleaned_data
+
+    def _iter_rows(self, start_index=None):
+        """
+        Yield (row_index, values) of data rows. Blank rows are skipped and
+        reading stops after Meta.stop_after_blank_rows blank rows in a row, so
+        formatted but empty rows at the end of the sheet are not read.
+        :param start_index: row index to start from, default Meta.start_index
+        """
+        if start_index is None:
+            start_index = self.start_index
+        max_rows = self.meta.max_rows
+        stop_after_blank_rows = self.meta.stop_after_blank_rows
 
-            if validation_errors:
+        rows = self.worksheet.iter_rows(
+            min_row=start_index + 1,
+            max_col=len(self.fields),
+            values_only=True
+        )
+
+        blank_rows = 0
+        data_rows = 0
+        for row_index, values in enumerate(rows, start=start_index):
+            if self._is_blank_row(values):
+                blank_rows += 1
+                if stop_after_blank_rows and blank_rows >= stop_after_blank_rows:
+                    return
                 continue
+            blank_rows = 0
+
+            data_rows += 1
+            if max_rows is not None and data_rows > max_rows:
+                message = _('This import allows at most %(max_rows)s rows.') % {'max_rows': max_rows}
+                self.validation_errors.append(message)
+                self.error_records.append(ErrorRecord(row_index + 1, None, None, message))
+                return
+            yield row_index, values
 
+    @staticmethod
+    def _is_blank_row(values):
+        """
+        Row is blank when every value is empty, zero, False or only spaces
+        """
+        if not any(values):
+            return True
+        for value in values:
+            if value and not (type(value) is str and value.isspace()):
+                return False
+        return True
+
+    def _serialize_row(self, row_index, row):
+        """
+        Validate a single row of cell values
+        :return: list of error messages and cleaned row
+        """
+        errors = []
+        values = []
+
+        for col_index, value in enumerate(row):
+            key = self.field_names[col_index]
+            field_object = self.fields[key]
+            field_object.value = value
             try:
-                self.row_extra_validation(row_index, cleaned_row)
+                field_object.validate(index=row_index + 1)
             except exceptions.ValidationError as error:
-                message = error_trans(
-                    index=row_index + 1,
-                    verbose_name='',
-                    message=error.message
+                errors.append(error.message)
+                self.error_records.append(
+                    ErrorRecord(row_index + 1, col_index + 1, key, error.message)
                 )
-                validation_errors.append(message)
+                field_object.reset()
                 continue
 
-            cleaned_data.append(cleaned_row)
+            try:
+                if key in self.extra_cleaners:
+                    extra_clean_value = self._extra_clean_validate(key)
+                    if extra_clean_value is not None:
+                        field_object.cleaned_value = extra_clean_value
+            except exceptions.ValidationError as error:
+                message = _('[Row %(index)s] %(error)s') % {
+                    'index': row_index + 1,
+                    'error': error.message
+                }
+                errors.append(message)
+                self.error_records.append(
+                    ErrorRecord(row_index + 1, col_index + 1, key, message)
+                )
+                field_object.reset()
+                continue
 
-        return validation_errors, cleaned_data
+            values.append(field_object.cleaned_value)
+            field_object.reset()
 
-    def _is_last_row(self, row, max_column):
-        none_cell = []
-        for index, cell in enumerate(row):
-            if index + 1 > max_column:
-                break
-            if cell.value is None:
-                none_cell.append(cell)
+        if errors:
+            return errors, None
+
+        cleaned_row = self._make_row(values)
+
+        try:
+            self.row_extra_validation(row_index, cleaned_row)
+        except exceptions.ValidationError as error:
+            message = error_trans(
+                index=row_index + 1,
+                verbose_name='',
+                message=error.message
+            )
+            self.error_records.append(
+                ErrorRecord(row_index + 1, None, None, message)
+            )
+            return [message], None
+
+        return errors, cleaned_row
+
+    def _make_row(self, values):
+        """
+        Build cleaned row of Meta.row_type from values in field order
+        """
+        row_type = self.meta.row_type
+        if row_type == 'dict':
+            return dict(zip(self.field_names, values))
+
+        if len(values) < len(self.field_names):
+            values.extend([None] * (len(self.field_names) - len(values)))
+        if row_type == 'record':
+            return self.row_class(values)
+        return tuple(values)
+
+    def get_row_value(self, cleaned_row, name):
+        """
+        Value of a field from a cleaned row of any Meta.row_type
+        """
+        if self.meta.row_type == 'dict':
+            return cleaned_row.get(name)
+        return cleaned_row[self.row_header[name]]
+
+    def _serialize_chunk(self, rows, raw_rows=None):
+        """
+        Validate a chunk of valid rows with checks that query the database in
+        batch instead of once per row. Duplicates within the file are checked
+        last, so only accepted rows are indexed.
+        :param rows: list of (row_index, cleaned_row)
+        :param raw_rows: {row_index: cell values} of the rows, invalid rows are
+            quarantined instead of returning their errors when given
+        :return: list of error messages and cleaned rows
+        """
+        row_errors = self._validate_unique_in_database(rows)
+        valid_rows = [row for row in rows if row[0] not in row_errors]
+        for row_index, messages in self._validate_chunk(valid_rows).items():
+            row_errors.setdefault(row_index, []).extend(messages)
+
+        errors = []
+        cleaned_rows = []
+        for row_index, cleaned_row in rows:
+            messages = row_errors.get(row_index) or self._validate_unique(row_index, cleaned_row)
+            if messages:
+                if raw_rows is not None:
+                    self._quarantine_row(row_index, raw_rows[row_index], messages)
+                else:
+                    errors.extend(messages)
                 continue
+            cleaned_rows.append(cleaned_row)
+            if self.aggregate_values:
+                self._accumulate_aggregates(row_index, cleaned_row)
+        return errors, cleaned_rows
 
-            if sys.version_info < (3, 0):
-                is_string = isinstance(cell.value, unicode)
+    def _quarantine_row(self, row_index, values, errors):
+        self.quarantined_rows += 1
+        self.quarantine.add(row_index + 1, values, errors)
+
+    def _accumulate_aggregates(self, row_index, cleaned_row):
+        for aggregate, values in zip(self.meta.aggregates, self.aggregate_values):
+            if aggregate.field is None:
+                value = True
+            else:
+                value = self.get_row_value(cleaned_row, aggregate.field)
+                if value in ('', None):
+                    continue
+            group = None
+            if aggregate.group_by is not None:
+                group = self.get_row_value(cleaned_row, aggregate.group_by)
+
+            state = values.get(group)
+            if state is None:
+                values[group] = [aggregate.accumulate(None, value), row_index]
             else:
-                is_string = isinstance(cell.value, str)
-            if is_string and not cell.value.strip():
-                none_cell.append(cell)
+                state[0] = aggregate.accumulate(state[0], value)
+                state[1] = row_index
+
+    def _validate_aggregates(self):
+        """
+        Check Meta.aggregates once every row is read. Errors are recorded on
+        the last row of the group.
+        :return: list of error messages
+        """
+        errors = []
+        for aggregate, values in zip(self.meta.aggregates, self.aggregate_values):
+            for group, (value, row_index) in values.items():
+                message = aggregate.validate(group, value)
+                if not message:
+                    continue
+                message = self._aggregate_error(aggregate, group, value, message)
+                errors.append(message)
+                column = None
+                if aggregate.field is not None:
+                    column = self.field_names.index(aggregate.field) + 1
+                self.error_records.append(ErrorRecord(row_index + 1, column, aggregate.field, message))
+        return errors
+
+    def _aggregate_error(self, aggregate, group, value, message):
+        data = {'function': _(aggregate.function_name), 'value': value, 'message': message}
+        if aggregate.field is None:
+            data['field'] = _('rows')
+        else:
+            data['field'] = self.fields[aggregate.field].verbose_name
+        if aggregate.group_by is None:
+            return _('%(function)s of %(field)s is %(value)s, it %(message)s') % data
+        data['group_name'] = self.fields[aggregate.group_by].verbose_name
+        data['group'] = group
+        return _('%(function)s of %(field)s for %(group_name)s %(group)s is %(value)s, it %(message)s') % data
+
+    def _validate_chunk(self, rows):
+        """
+        Call validate_chunk and turn its errors into row error messages
+        :return: {row_index: [error messages]}
+        """
+        if not rows:
+            return {}
+        result = self.validate_chunk(rows) or {}
+
+        row_errors = {}
+        for row_index, errors in result.items():
+            if not errors:
                 continue
-            if not cell.value:
-                none_cell.append(cell)
-        return len(none_cell) >= max_column
+            if not isinstance(errors, (list, tuple)):
+                errors = [errors]
+            for error in errors:
+                message = _('[Row %(index)s] %(error)s') % {
+                    'index': row_index + 1,
+                    'error': error
+                }
+                self.error_records.append(ErrorRecord(row_index + 1, None, None, message))
+                row_errors.setdefault(row_index, []).append(message)
+        return row_errors
 
-    def _extra_clean_validate(self, key):
-        try:
-            extra_clean = 'extra_clean_{}'.format(key)
-            extra_clean_def = getattr(self, extra_clean)
-        except AttributeError:
-            return
+    def _unique_key(self, names, cleaned_row):
+        """
+        Value of the unique check, None when one of the values is blank
+        """
+        key = tuple(self.get_row_value(cleaned_row, name) for name in names)
+        for value in key:
+            if value in ['', None]:
+                return None
+        return key
+
+    def _unique_error(self, row_index, names, message):
+        verbose_name = u', '.join(self.fields[name].verbose_name for name in names)
+        message = error_trans(index=row_index + 1, verbose_name=verbose_name, message=message)
+        column = self.field_names.index(names[0]) + 1
+        self.error_records.append(ErrorRecord(row_index + 1, column, names[0], message))
+        return message
+
+    def _validate_unique(self, row_index, cleaned_row):
+        """
+        Check Meta.unique_fields and Meta.unique_together against the rows
+        already seen in this file with hash indexes
+        """
+        errors = []
+        keys = []
+        for names in self.meta.unique_checks:
+            key = self._unique_key(names, cleaned_row)
+            if key is None:
+                continue
+            first_row = self.unique_indexes[names].get(key)
+            if first_row is not None:
+                message = _('is duplicated with row %(row)s.') % {'row': first_row}
+                errors.append(self._unique_error(row_index, names, message))
+                continue
+            keys.append((names, key))
+
+        # Called for rows accepted by every other check, so later duplicates
+        # refer to a row that is imported
+        if not errors:
+            for names, key in keys:
+                self.unique_indexes[names][key] = row_index + 1
+        return errors
+
+    def _validate_unique_in_database(self, rows):
+        """
+        Check unique values of the chunk against get_unique_queryset with one
+        query per unique check and UNIQUE_QUERY_BATCH_SIZE keys
+        :return: {row_index: [error messages]}
+        """
+        if self.committed_row is not None:
+            rows = [row for row in rows if row[0] > self.committed_row]
+        if not rows or not self.meta.unique_checks:
+            return {}
+        queryset = self.get_unique_queryset()
+        if queryset is None:
+            return {}
+
+        from django.db.models import Q
+
+        row_errors = {}
+        for names in self.meta.unique_checks:
+            keyed_rows = []
+            for row_index, cleaned_row in rows:
+                key = self._unique_key(names, cleaned_row)
+                if key is not None:
+                    keyed_rows.append((row_index, key))
+            if not keyed_rows:
+                continue
+
+            keys = list(set(key for row_index, key in keyed_rows))
+            existing = set()
+            # One OR condition per key nests the SQL expression, keys are
+            # queried in batches to stay below database expression limits
+            for start in range(0, len(keys), UNIQUE_QUERY_BATCH_SIZE):
+                batch = keys[start:start + UNIQUE_QUERY_BATCH_SIZE]
+                if len(names) == 1:
+                    lookup = {'{}__in'.format(names[0]): [key[0] for key in batch]}
+                    matches = queryset.filter(**lookup)
+                else:
+                    conditions = [Q(**dict(zip(names, key))) for key in batch]
+                    matches = queryset.filter(reduce(lambda a, b: a | b, conditions))
+                existing.update(tuple(values) for values in matches.values_list(*names))
 
-        if not callable(extra_clean_def):
+            for row_index, key in keyed_rows:
+                if key in existing:
+                    message = self._unique_error(row_index, names, _('already exists.'))
+                    row_errors.setdefault(row_index, []).append(message)
+        return row_errors
+
+    def _extra_clean_validate(self, key):
+        extra_clean_def = self.extra_cleaners.get(key)
+        if extra_clean_def is None:
             return
 
         validated_field = self.fields[key]
@@ -205,12 +815,15 @@ class BaseSerializer(object):
         return extra_clean_def(cleaned_value)
 
     def _start_operation(self):
-        if self.meta.enable_transaction:
+        if not self.meta.enable_transaction:
             try:
                 self.import_operation(self.cleaned_data)
+                self._write_quarantine()
                 self.operation_success()
             except exceptions.ImportOperationFailed:
                 self.operation_failed(self.operation_errors)
+            finally:
+                self._close_quarantine()
             return
 
         try:
@@ -223,9 +836,29 @@ class BaseSerializer(object):
         try:
             with transaction.atomic():
                 self.import_operation(self.cleaned_data)
+                self._write_quarantine()
             self.operation_success()
         except exceptions.ImportOperationFailed:
             self.operation_failed(self.operation_errors)
+        finally:
+            self._close_quarantine()
+
+    def _write_quarantine(self):
+        """
+        Write the rows quarantined while validating to the sink, called after
+        import_operation inside its transaction
+        """
+        buffer = self.quarantine_buffer
+        if buffer is None:
+            return
+        for row, values, errors in buffer.rows:
+            self.quarantine.add(row, values, errors)
+        self.quarantine.flush()
+        buffer.rows = []
+
+    def _close_quarantine(self):
+        if self.quarantine is not None:
+            self.quarantine.close()
 
     def import_operation(self, cleaned_data):
         pass
@@ -245,6 +878,30 @@ class BaseSerializer(object):
     def row_extra_validation(self, index, cleaned_row):
         pass
 
+    def validate_chunk(self, rows):
+        """
+        Override to validate up to Meta.chunk_size rows at once, e.g. with one
+        query for all referenced records instead of one query per row.
+        :param rows: list of (index, cleaned_row) of valid rows
+        :return: {index: error message or list of messages} of invalid rows
+        """
+        return {}
+
+    def get_quarantine(self):
+        """
+        Sink of invalid rows when Meta.partial_import is set, the `quarantine`
+        keyword argument or a ListQuarantine by default.
+        See `django_excel_tools.quarantine`.
+        """
+        return self.kwargs.get('quarantine') or ListQuarantine()
+
+    def get_unique_queryset(self):
+        """
+        Override to also check Meta.unique_fields and Meta.unique_together
+        against existing records, e.g. `return Order.objects.all()`.
+        """
+        return None
+
 
 class ExcelSerializer(BaseSerializer):
 
@@ -252,3 +909,178 @@ class ExcelSerializer(BaseSerializer):
         # + 1 to make it equal to sheet index
         sheet_index = self.start_index + index + 1
         return _('[Row %(index)s] %(error)s') % {'index': sheet_index, 'error': error}
+
+
+class WorkbookSerializerMeta:
+
+    def __init__(self, meta):
+        assert meta is not None, 'Meta cannot be None.'
+
+        assert hasattr(meta, 'sheets'), 'Meta.sheets is required.'
+        assert meta.sheets, 'Must not empty or None.'
+        assert type(meta.sheets) in [list, tuple], 'Must be iteratable type list or tuple.'
+        self.sheets = OrderedDict(meta.sheets)
+
+        self.dependencies = getattr(meta, 'dependencies', {})
+        assert type(self.dependencies) is dict, 'Meta.dependencies must be dict.'
+
+        self.lookups = getattr(meta, 'lookups', {})
+        assert type(self.lookups) is dict, 'Meta.lookups must be dict.'
+
+        if hasattr(meta, 'enable_transaction'):
+            assert type(meta.enable_transaction) is bool, 'Type must be bool.'
+        self.enable_transaction = getattr(meta, 'enable_transaction', True)
+
+
+class WorkbookSerializer(object):
+    """
+    Serialize several sheets of one workbook, each sheet with its own
+    ExcelSerializer class.
+
+    Sheets are processed in dependency order inside one transaction. Cleaned
+    rows of the sheets listed in ``Meta.lookups`` are indexed in memory so that
+    a later sheet can resolve keys with ``self.workbook.lookup(sheet, key)``
+    instead of querying the database.
+    """
+
+    def __init__(self, workbook, **kwargs):
+        self.kwargs = kwargs
+        self.meta = WorkbookSerializerMeta(getattr(self, 'Meta', None))
+        self.workbook = self._load_workbook(workbook)
+
+        self.serializers = OrderedDict()
+        self.indexes = {}
+        self.validation_errors = []
+        self.operation_errors = []
+
+        try:
+            self.sheet_names = self._get_sheet_order()
+            self._start_operation()
+        finally:
+            # Workbooks loaded here are read-only and keep the file open
+            if self.workbook is not workbook:
+                self.workbook.close()
+
+        if self.validation_errors:
+            self.invalid(self.validation_errors)
+        elif self.operation_errors:
+            self.operation_failed(self.operation_errors)
+        else:
+            self.operation_success()
+
+    @staticmethod
+    def _load_workbook(workbook):
+        """
+        Accept an openpyxl workbook, a file path, a file object or a Django
+        UploadedFile. Files are parsed only once in read-only mode and shared
+        by every sheet, and closed when every sheet is processed.
+        """
+        from django_excel_tools.uploads import open_workbook
+        return open_workbook(workbook)
+
+    def _get_sheet_order(self):
+        """
+        Sort sheets so that every sheet comes after the sheets it depends on,
+        otherwise keep the order declared in Meta.sheets.
+        """
+        sheet_names = list(self.meta.sheets.keys())
+        for name, depends_on in self.meta.dependencies.items():
+            for dependency in [name] + list(depends_on):
+                if dependency not in self.meta.sheets:
+                    message = '{} is not defined in Meta.sheets'.format(dependency)
+                    raise exceptions.SerializerConfigError(message=message)
+
+        ordered = []
+        visiting = set()
+
+        def visit(name):
+            if name in ordered:
+                return
+            if name in visiting:
+                message = 'Circular dependency found at sheet {}'.format(name)
+                raise exceptions.SerializerConfigError(message=message)
+            visiting.add(name)
+            for dependency in self.meta.dependencies.get(name, ()):
+                visit(dependency)
+            visiting.discard(name)
+            ordered.append(name)
+
+        for name in sheet_names:
+            visit(name)
+        return ordered
+
+    def _start_operation(self):
+        if not self.meta.enable_transaction:
+            self._proceed_sheets()
+            return
+
+        from django.db import transaction
+
+        with transaction.atomic():
+            self._proceed_sheets()
+            if self.validation_errors or self.operation_errors:
+                transaction.set_rollback(True)
+
+    def _proceed_sheets(self):
+        for name in self.sheet_names:
+            if name not in self.workbook.sheetnames:
+                self.validation_errors.append(
+                    _('Sheet "%(sheet)s" is not found in this excel.') % {'sheet': name}
+                )
+                return
+
+            serializer_class = self.meta.sheets[name]
+            kwargs = dict(self.kwargs, workbook=self)
+            serializer = serializer_class(self.workbook[name], **kwargs)
+            self.serializers[name] = serializer
+
+            if serializer.validation_errors:
+                self.validation_errors.extend(
+                    self._sheet_errors(name, serializer.validation_errors)
+                )
+                return
+            if serializer.operation_errors:
+                self.operation_errors.extend(
+                    self._sheet_errors(name, serializer.operation_errors)
+                )
+                return
+
+            if name in self.meta.lookups:
+                self.indexes[name] = self._build_index(
+                    serializer, self.meta.lookups[name]
+                )
+
+    @staticmethod
+    def _sheet_errors(name, errors):
+        return [
+            u'[{}] {}'.format(name, error) for error in errors
+        ]
+
+    @staticmethod
+    def _build_index(serializer, key):
+        index = {}
+        for cleaned_row in serializer.cleaned_data:
+            index[serializer.get_row_value(cleaned_row, key)] = cleaned_row
+        return index
+
+    def lookup(self, sheet_name, key, default=None):
+        """
+        Return the cleaned row of an already processed sheet by its lookup key.
+        Rows are shared with the sheet's import_operation, so anything it
+        stores on a row (e.g. the created instance) is visible here.
+        """
+        try:
+            index = self.indexes[sheet_name]
+        except KeyError:
+            message = '{} is not indexed, add it to Meta.lookups'.format(sheet_name)
+            raise exceptions.SerializerConfigError(message=message)
+        return index.get(key, default)
+
+    def invalid(self, errors):
+        pass
+
+    def operation_failed(self, errors):
+        pass
+
+    def operation_success(self):
+        pass
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Adapters for running import jobs on task queues. Celery and RQ are optional,
+install them with `pip install django-excel-tools[celery]` or `[rq]`.
+"""
+from django_excel_tools.jobs import ImportJob
+
+
+def run_import_job(serializer_path, file_path, job_id, sheet_name=None, chunk_size=None, using=None):
+    """
+    Task body that only takes serializable arguments. The workbook is opened in
+    read-only mode and progress is kept in ModelCheckpointStore, so a retried
+    task resumes after the last committed chunk.
+    :param serializer_path: dotted path of the serializer class
+    :return: dict of the final checkpoint
+    """
+    from django.utils.module_loading import import_string
+    from openpyxl import load_workbook
+
+    serializer_class = import_string(serializer_path)
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if sheet_name:
+            worksheet = workbook[sheet_name]
+        else:
+            worksheet = workbook.worksheets[0]
+        job = ImportJob(serializer_class, worksheet, job_id, chunk_size=chunk_size, using=using)
+        checkpoint = job.run()
+    finally:
+        workbook.close()
+    return dict(vars(checkpoint))
+
+
+def celery_task(app, **options):
+    """
+    Register run_import_job as a task of the celery app.
+        import_excel = celery_task(app)
+        import_excel.delay('myapp.serializers.StaffSerializer', path, job_id)
+    """
+    options.setdefault('name', 'django_excel_tools.run_import_job')
+    return app.task(**options)(run_import_job)
+
+
+def rq_enqueue(queue, serializer_path, file_path, job_id, **kwargs):
+    """
+    Enqueue run_import_job on a RQ queue.
+    """
+    return queue.enqueue(run_import_job, serializer_path, file_path, job_id, **kwargs)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Open uploaded files without copying them into another buffer. Django keeps
+small uploads in memory and writes bigger ones to a temporary file, openpyxl
+reads the zip archive directly from either of them.
+"""
+from contextlib import contextmanager
+
+
+def get_file_source(source):
+    """
+    Path or file object of source that openpyxl can read without a copy.
+    :param source: path, file object or Django UploadedFile
+    """
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        return source
+
+    # TemporaryUploadedFile is already on disk, the zip archive is read from
+    # the file instead of the upload buffer
+    temporary_file_path = getattr(source, 'temporary_file_path', None)
+    if temporary_file_path is not None:
+        return temporary_file_path()
+
+    # InMemoryUploadedFile wraps a BytesIO holding the upload
+    fileobj = getattr(source, 'file', None) or source
+    if hasattr(fileobj, 'seek'):
+        fileobj.seek(0)
+    return fileobj
+
+
+def open_workbook(source, read_only=True, data_only=True):
+    """
+    Load source as a workbook, read-only by default so rows are parsed while
+    they are iterated. Workbooks are returned as they are.
+    """
+    if hasattr(source, 'sheetnames'):
+        return source
+
+    from openpyxl import load_workbook
+    return load_workbook(get_file_source(source), read_only=read_only, data_only=data_only)
+
+
+@contextmanager
+def opened_workbook(source, read_only=True, data_only=True):
+    """
+    Context manager of open_workbook. A workbook opened from a path or a file
+    is closed on exit, read-only workbooks keep the file open until then.
+    """
+    workbook = open_workbook(source, read_only=read_only, data_only=data_only)
+    try:
+        yield workbook
+    finally:
+        if workbook is not source:
+            workbook.close()
+
+
+def get_worksheet(workbook, sheet_name=None):
+    """
+    Worksheet sheet_name of workbook, default is the first sheet
+    """
+    if sheet_name:
+        return workbook[sheet_name]
+    return workbook.worksheets[0]
+
+
+def open_worksheet(source, sheet_name=None):
+    """
+    Worksheet sheet_name of source, default is the first sheet. Close
+    `worksheet.parent` when done, or use opened_workbook.
+    """
+    return get_worksheet(open_workbook(source), sheet_name)
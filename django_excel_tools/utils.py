@@ -1,17 +1,164 @@
-from .exceptions import SerializerConfigError
-try:
-    import django
+import hashlib
+import os
+import sys
+from collections import namedtuple
 
-    major, feature, minor, a, b = django.VERSION
-    if major >= 2:
-        from django.utils.translation import gettext as _
+# Django translation functions, imported on first use
+_django_gettext = None
+_get_language = None
+
+# (language, message id) -> translated message
+_translation_cache = {}
+TRANSLATION_CACHE_SIZE = 1000
+
+
+def _load_django_gettext():
+    """
+    Import Django translation machinery once settings are configured
+    :return: gettext function or None when it cannot be used yet
+    """
+    global _django_gettext, _get_language
+    # Settings cannot be configured before django.conf is imported, unless
+    # they are loaded lazily from DJANGO_SETTINGS_MODULE
+    if 'django.conf' not in sys.modules and not os.environ.get('DJANGO_SETTINGS_MODULE'):
+        return None
+    try:
+        import django
+        from django.conf import settings
+    except ImportError:
+        return None
+    if not settings.configured:
+        return None
+
+    from django.core.signals import setting_changed
+    from django.utils.translation import get_language
+    if django.VERSION[0] >= 2:
+        from django.utils.translation import gettext
     else:
-        from django.utils.translation import ugettext as _
-except ImportError:
-    raise SerializerConfigError('Django is required. Please make sure you '
-                                'have install via pip.')
+        from django.utils.translation import ugettext as gettext
+
+    setting_changed.connect(_clear_translation_cache_on_setting_changed)
+    _get_language = get_language
+    _django_gettext = gettext
+    return gettext
+
+
+def clear_translation_cache():
+    _translation_cache.clear()
+
+
+def _clear_translation_cache_on_setting_changed(setting, **kwargs):
+    if setting in ('LANGUAGES', 'LANGUAGE_CODE', 'LOCALE_PATHS', 'USE_I18N'):
+        clear_translation_cache()
+
+
+def gettext(message):
+    """
+    Translate message with Django. Translations are cached per active
+    language, so a message id is looked up in the catalog once per language
+    instead of once per error.
+
+    Without Django or configured settings the message is returned as is, so
+    fields can validate values in scripts that don't set up Django.
+    """
+    if _django_gettext is None and _load_django_gettext() is None:
+        return message
+
+    key = (_get_language(), message)
+    try:
+        return _translation_cache[key]
+    except KeyError:
+        pass
+
+    if len(_translation_cache) >= TRANSLATION_CACHE_SIZE:
+        _translation_cache.clear()
+    translated = _django_gettext(message)
+    _translation_cache[key] = translated
+    return translated
+
+
+_ = gettext
+
+
+def gettext_noop(message):
+    """
+    Mark message for translation without translating it yet
+    """
+    return message
 
 
 def error_trans(index, verbose_name, message):
     data = {'index': index, 'verbose_name': verbose_name, 'msg': message}
     return _('[Row %(index)s] %(verbose_name)s %(msg)s') % data
+
+
+def normalize_header(value):
+    """
+    Header text compared without case and extra spaces
+    """
+    if value is None:
+        return ''
+    return ' '.join(str(value).split()).casefold()
+
+
+def header_fingerprint(values):
+    """
+    Hash of normalized header cells, identifies a version of an import template
+    """
+    text = '\x1f'.join(normalize_header(value) for value in values)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+# Validation error with its sheet coordinates, row and column are 1-based.
+# column and field are None for errors of the whole row or sheet.
+ErrorRecord = namedtuple('ErrorRecord', ['row', 'column', 'field', 'message'])
+
+
+class Row(tuple):
+    """
+    Read-only cleaned row stored as a tuple, items can be accessed by field
+    name like a dict so `row['name']` and `Model(**row)` keep working.
+    Iterating yields values like a tuple.
+    """
+    __slots__ = ()
+    _fields = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        if type(key) is str:
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def get(self, key, default=None):
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return tuple.__getitem__(self, index)
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return zip(self._fields, self)
+
+    def to_dict(self):
+        return dict(zip(self._fields, self))
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self.to_dict())
+
+
+def make_row_class(name, field_names):
+    """
+    Subclass of Row with its own field names, instances have no __dict__ so
+    a row costs the same memory as a plain tuple.
+    """
+    field_names = tuple(field_names)
+    index = dict((field_name, position) for position, field_name in enumerate(field_names))
+    return type(name, (Row,), {'__slots__': (), '_fields': field_names, '_index': index})
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import re
+
+from .exceptions import ValidationError
+from .utils import _, gettext_noop
+
+
+class BaseValidator(object):
+    """
+    Validator called with the cleaned value of a field. Everything that can be
+    prepared (compiled patterns, limits) is done once in __init__, calling the
+    validator only checks the value.
+
+    A failing validator raises ValidationError with a message without row and
+    field name, the field adds them. `message` overrides the default message
+    and may use %(value)s and %(limit)s.
+    """
+    default_message = None
+
+    def __init__(self, limit=None, message=None):
+        self.limit = limit
+        self.message = message
+
+    def __call__(self, value):
+        if not self.is_valid(value):
+            raise ValidationError(message=self.get_message(value))
+
+    def is_valid(self, value):
+        raise NotImplementedError
+
+    def get_message(self, value):
+        message = _(self.message or self.default_message)
+        return message % {'value': value, 'limit': self.limit}
+
+
+class MinValueValidator(BaseValidator):
+    default_message = gettext_noop('must be greater than or equal to %(limit)s.')
+
+    def is_valid(self, value):
+        return value >= self.limit
+
+
+class MaxValueValidator(BaseValidator):
+    default_message = gettext_noop('must be less than or equal to %(limit)s.')
+
+    def is_valid(self, value):
+        return value <= self.limit
+
+
+class MinLengthValidator(BaseValidator):
+    default_message = gettext_noop('must be at least %(limit)s characters.')
+
+    def is_valid(self, value):
+        return len(value) >= self.limit
+
+
+class MaxLengthValidator(BaseValidator):
+    default_message = gettext_noop('must be at most %(limit)s characters.')
+
+    def is_valid(self, value):
+        return len(value) <= self.limit
+
+
+class RegexValidator(BaseValidator):
+    """
+    Value must match the pattern from its start, the pattern is compiled once.
+    With inverse_match=True the value must not match.
+    """
+    default_message = gettext_noop('"%(value)s" is incorrect format.')
+
+    def __init__(self, pattern, message=None, flags=0, inverse_match=False):
+        super(RegexValidator, self).__init__(message=message)
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, flags)
+        self.pattern = pattern
+        self.limit = pattern.pattern
+        self.inverse_match = inverse_match
+
+    def is_valid(self, value):
+        matched = self.pattern.match(str(value)) is not None
+        return matched is not self.inverse_match
+
+
+class EmailValidator(RegexValidator):
+    default_message = gettext_noop('"%(value)s" is not a valid email address.')
+    email_pattern = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s.]+$')
+
+    def __init__(self, message=None):
+        super(EmailValidator, self).__init__(self.email_pattern, message=message)
@@ -20,25 +20,29 @@ setup(
     description="Common function when working with excel.",
     long_description=readme + '\n\n' + changelog,
     long_description_content_type='text/markdown',
-    packages=find_packages(include=['django_excel_tools']),
+    packages=find_packages(include=['django_excel_tools', 'django_excel_tools.*']),
     include_package_data=True,
     license="MIT license",
     zip_safe=False,
+    python_requires='>=3.5',
     keywords='django, excel, tools',
     setup_requires=[
         'setuptools-git-version'
     ],
+    extras_require={
+        'celery': ['celery'],
+        'rq': ['rq'],
+    },
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
     ]
 )
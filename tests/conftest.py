@@ -1,4 +1,9 @@
 import os
+import shutil
+import tempfile
+
+# Database file shared with the worker processes of batch imports
+BATCH_DATABASE_DIR = tempfile.mkdtemp()
 
 
 def pytest_configure():
@@ -10,6 +15,10 @@ def pytest_configure():
             'default': {
                 'ENGINE': 'django.db.backends.sqlite3',
                 'NAME': ':memory:'
+            },
+            'batch': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': os.path.join(BATCH_DATABASE_DIR, 'batch.sqlite3')
             }
         },
         SITE_ID=1,
@@ -40,6 +49,7 @@ def pytest_configure():
             'django.contrib.messages',
             'django.contrib.staticfiles',
 
+            'django_excel_tools',
             'tests',
         ),
         PASSWORD_HASHERS=(
@@ -52,3 +62,7 @@ def pytest_configure():
         django.setup()
     except AttributeError:
         pass
+
+
+def pytest_unconfigure():
+    shutil.rmtree(BATCH_DATABASE_DIR, ignore_errors=True)
@@ -0,0 +1,97 @@
+import unittest
+
+from openpyxl import Workbook
+
+from django_excel_tools import serializers
+from django_excel_tools.aggregates import Count, Max, Min, Sum
+from django_excel_tools.jobs import Checkpoint, ImportJob, MemoryCheckpointStore
+
+
+class OrderExcelSerializer(serializers.ExcelSerializer):
+    shop = serializers.CharField(max_length=10, verbose_name='Shop')
+    quantity = serializers.IntegerField(verbose_name='Quantity', blank=True)
+
+    class Meta:
+        start_index = 1
+        fields = ('shop', 'quantity')
+        aggregates = []
+
+    def import_operation(self, cleaned_data):
+        self.imported = cleaned_data
+
+
+class TestAggregates(unittest.TestCase):
+    def setUp(self):
+        self.workbook = Workbook()
+        self.worksheet = self.workbook.active
+        self.worksheet.append(['Shop', 'Quantity'])
+        for row in [['A', 5], ['B', 1], ['A', 7], ['B', None], ['A', 'X']]:
+            self.worksheet.append(row)
+
+    def get_serializer_class(self, aggregates, row_type='dict'):
+        class Serializer(OrderExcelSerializer):
+            class Meta(OrderExcelSerializer.Meta):
+                pass
+
+        Serializer.Meta.aggregates = aggregates
+        Serializer.Meta.row_type = row_type
+        return Serializer
+
+    def test_grouped_sum(self):
+        stocks = {'A': 10, 'B': 10}
+        self.worksheet.delete_rows(6)
+        serializer = self.get_serializer_class(
+            [Sum('quantity', group_by='shop', max_value=stocks.get)]
+        )(self.worksheet)
+        self.assertEqual(
+            serializer.validation_errors,
+            ['Sum of Quantity for Shop A is 12, it must be less than or equal to 10.']
+        )
+        record = serializer.error_records[0]
+        self.assertEqual((record.row, record.column, record.field), (4, 2, 'quantity'))
+        self.assertEqual(serializer.aggregate_values[0], {'A': [12, 3], 'B': [1, 2]})
+
+    def test_invalid_rows_are_not_accumulated(self):
+        serializer = self.get_serializer_class(
+            [Sum('quantity', group_by='shop'), Count(group_by='shop')], row_type='tuple'
+        )(self.worksheet)
+        self.assertEqual(len(serializer.validation_errors), 1)
+        self.assertEqual(serializer.aggregate_values[0], {'A': [12, 3], 'B': [1, 2]})
+        self.assertEqual(serializer.aggregate_values[1], {'A': [2, 3], 'B': [2, 4]})
+
+    def test_min_max_and_check(self):
+        self.worksheet.delete_rows(6)
+        serializer = self.get_serializer_class([
+            Min('quantity', min_value=2),
+            Max('quantity', max_value=7),
+            Sum('quantity', check=lambda group, value: None if value == 13 else 'must be 13.'),
+        ])(self.worksheet)
+        self.assertEqual(
+            serializer.validation_errors,
+            ['Min of Quantity is 1, it must be greater than or equal to 2.']
+        )
+
+    def test_import_job(self):
+        self.worksheet.delete_rows(6)
+        serializer_class = self.get_serializer_class([Count(max_value=3)])
+        job = ImportJob(serializer_class, self.worksheet, 'orders', store=MemoryCheckpointStore(), chunk_size=2)
+        checkpoint = job.run()
+        self.assertEqual(checkpoint.status, Checkpoint.INVALID)
+        self.assertEqual(job.serializer.validation_errors, ['Count of rows is 4, it must be less than or equal to 3.'])
+        self.assertFalse(hasattr(job.serializer, 'imported'))
+        self.assertIsNone(checkpoint.last_row)
+
+    def test_import_job_rerun_stays_invalid(self):
+        self.worksheet.delete_rows(6)
+        serializer_class = self.get_serializer_class([Sum('quantity', max_value=5)])
+        store = MemoryCheckpointStore()
+        ImportJob(serializer_class, self.worksheet, 'orders', store=store, chunk_size=2).run()
+        job = ImportJob(serializer_class, self.worksheet, 'orders', store=store, chunk_size=2)
+        checkpoint = job.run()
+        self.assertEqual(checkpoint.status, Checkpoint.INVALID)
+        self.assertEqual(checkpoint.imported_rows, 0)
+        self.assertFalse(hasattr(job.serializer, 'imported'))
+
+    def test_field_must_be_declared(self):
+        with self.assertRaises(AssertionError):
+            self.get_serializer_class([Sum('price')])(self.worksheet)
@@ -0,0 +1,183 @@
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from openpyxl import Workbook
+
+from django_excel_tools import serializers
+from django_excel_tools.batches import FileReport, collect_files, import_file, run_batch
+from django_excel_tools.models import ImportCheckpoint
+
+IMPORTED = []
+IMPORT_CALLS = []
+
+
+class PartnerExcelSerializer(serializers.ExcelSerializer):
+    code = serializers.IntegerField(verbose_name='Code')
+    name = serializers.CharField(max_length=10, verbose_name='Name')
+
+    class Meta:
+        start_index = 1
+        fields = ('code', 'name')
+
+    def import_operation(self, cleaned_data):
+        IMPORT_CALLS.append(len(cleaned_data))
+        IMPORTED.extend(cleaned_data)
+
+
+class StoredPartnerExcelSerializer(PartnerExcelSerializer):
+    """
+    Imports rows into the file-backed batch database, so rows imported by
+    worker processes can be checked
+    """
+
+    def import_operation(self, cleaned_data):
+        for row in cleaned_data:
+            ImportCheckpoint.objects.using('batch').create(job_id='partner-{}'.format(row['code']), status='imported')
+
+
+SERIALIZER_PATH = 'tests.test_batches.PartnerExcelSerializer'
+STORED_SERIALIZER_PATH = 'tests.test_batches.StoredPartnerExcelSerializer'
+
+
+class TestBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', 'django_excel_tools', database='batch', verbosity=0)
+
+    def setUp(self):
+        IMPORTED[:] = []
+        ImportCheckpoint.objects.using('batch').all().delete()
+        self.directory = tempfile.mkdtemp()
+        self.write_file('a.xlsx', [[1, 'Shop A'], [2, 'Shop B']])
+        self.write_file('b.xlsx', [[3, 'Shop C']])
+        self.write_file('c.xlsx', [['X', 'Shop D']])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_file(self, name, rows):
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append(['Code', 'Name'])
+        for row in rows:
+            worksheet.append(row)
+        workbook.save(os.path.join(self.directory, name))
+
+    def test_collect_files(self):
+        names = [os.path.basename(path) for path in collect_files(self.directory)]
+        self.assertEqual(names, ['a.xlsx', 'b.xlsx', 'c.xlsx'])
+        names = [os.path.basename(path) for path in collect_files(os.path.join(self.directory, 'a*'))]
+        self.assertEqual(names, ['a.xlsx'])
+
+    def test_run_in_process(self):
+        report = run_batch(PartnerExcelSerializer, self.directory, workers=1)
+        self.assertEqual(
+            [(file_report.status, file_report.rows) for file_report in report.files],
+            [(FileReport.IMPORTED, 2), (FileReport.IMPORTED, 1), (FileReport.INVALID, 0)]
+        )
+        self.assertFalse(report.is_success)
+        self.assertEqual([row['code'] for row in IMPORTED], [1, 2, 3])
+        self.assertIn('a.xlsx', report.as_table())
+
+    def test_run_in_processes(self):
+        report = run_batch(SERIALIZER_PATH, self.directory, workers=2, dry_run=True)
+        self.assertEqual(
+            [file_report.status for file_report in report.files],
+            [FileReport.VALID, FileReport.VALID, FileReport.INVALID]
+        )
+        self.assertEqual(len(report.files[2].errors), 1)
+        self.assertEqual(IMPORTED, [])
+
+    def test_import_in_processes(self):
+        for chunk_size in [None, 1]:
+            ImportCheckpoint.objects.using('batch').all().delete()
+            report = run_batch(STORED_SERIALIZER_PATH, self.directory, workers=2, chunk_size=chunk_size)
+            self.assertEqual(
+                [(file_report.status, file_report.rows) for file_report in report.files],
+                [(FileReport.IMPORTED, 2), (FileReport.IMPORTED, 1), (FileReport.INVALID, 0)]
+            )
+            job_ids = ImportCheckpoint.objects.using('batch').order_by('job_id').values_list('job_id', flat=True)
+            self.assertEqual(list(job_ids), ['partner-1', 'partner-2', 'partner-3'])
+
+    def test_unreadable_file(self):
+        path = os.path.join(self.directory, 'broken.xlsx')
+        with open(path, 'w') as fileobj:
+            fileobj.write('not a workbook')
+        report = run_batch(PartnerExcelSerializer, [path], workers=1)
+        self.assertEqual(report.files[0].status, FileReport.ERROR)
+
+    def test_command(self):
+        stdout = StringIO()
+        with self.assertRaises(CommandError):
+            call_command(
+                'excel_batch_import', SERIALIZER_PATH, self.directory,
+                workers=1, dry_run=True, stdout=stdout, stderr=StringIO()
+            )
+        self.assertIn('c.xlsx', stdout.getvalue())
+        self.assertEqual(IMPORTED, [])
+
+
+class TestImportCommand(unittest.TestCase):
+    def setUp(self):
+        IMPORTED[:] = []
+        IMPORT_CALLS[:] = []
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'partners.xlsx')
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append(['Code', 'Name'])
+        for code in range(1, 6):
+            worksheet.append([code, 'Shop'])
+        workbook.save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_import(self):
+        stdout = StringIO()
+        call_command('excel_import', SERIALIZER_PATH, self.path, stdout=stdout)
+        self.assertEqual([row['code'] for row in IMPORTED], [1, 2, 3, 4, 5])
+        self.assertEqual(IMPORT_CALLS, [5])
+        self.assertIn('imported', stdout.getvalue())
+
+    def test_import_in_chunks(self):
+        stdout = StringIO()
+        call_command('excel_import', SERIALIZER_PATH, self.path, chunk_size=2, stdout=stdout)
+        self.assertEqual([row['code'] for row in IMPORTED], [1, 2, 3, 4, 5])
+        self.assertEqual(IMPORT_CALLS, [2, 2, 1])
+        self.assertIn('imported', stdout.getvalue())
+
+    def test_dry_run(self):
+        call_command('excel_import', SERIALIZER_PATH, self.path, dry_run=True, stdout=StringIO())
+        self.assertEqual(IMPORTED, [])
+
+    def test_max_errors(self):
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append(['Code', 'Name'])
+        for _ in range(5):
+            worksheet.append(['X', 'Shop'])
+        workbook.save(self.path)
+
+        stderr = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('excel_import', SERIALIZER_PATH, self.path, max_errors=2, stdout=StringIO(), stderr=stderr)
+        self.assertEqual(len(stderr.getvalue().splitlines()), 2)
+
+        report = import_file(PartnerExcelSerializer, self.path, chunk_size=5, max_errors=2)
+        self.assertEqual(report.status, FileReport.INVALID)
+        self.assertEqual(len(report.errors), 2)
+
+    def test_profile(self):
+        stats_path = os.path.join(self.directory, 'import.prof')
+        call_command('excel_import', SERIALIZER_PATH, self.path, profile=stats_path, stdout=StringIO())
+        self.assertTrue(os.path.exists(stats_path))
+
+        stdout = StringIO()
+        call_command('excel_import', SERIALIZER_PATH, self.path, '--profile', stdout=stdout)
+        self.assertIn('cumulative', stdout.getvalue())
@@ -0,0 +1,158 @@
+import datetime
+import unittest
+from io import BytesIO
+
+from openpyxl import Workbook, load_workbook
+
+from django_excel_tools import serializers
+
+
+class StaffExcelSerializer(serializers.ExcelSerializer):
+    code = serializers.IntegerField(verbose_name='Code')
+    gender = serializers.CharField(
+        max_length=6, verbose_name='Gender', choices=['Male', 'Female'], case_sensitive=False
+    )
+    date_of_birth = serializers.DateField(
+        verbose_name='Date of Birth', date_format='%Y%m%d', date_format_verbose='YYYYMMDD', blank=True
+    )
+    active = serializers.BooleanField(verbose_name='Active')
+
+    class Meta:
+        start_index = 1
+        fields = ('code', 'gender', 'date_of_birth', 'active')
+
+    def import_operation(self, cleaned_data):
+        self.imported = cleaned_data
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            (1, 'female', datetime.date(1990, 1, 31), True),
+            (2, 'MALE', None, False),
+        ]
+
+    def test_export_values_formatted_by_fields(self):
+        fileobj = StaffExcelSerializer.export(self.rows, BytesIO())
+        worksheet = load_workbook(fileobj).active
+        values = list(worksheet.values)
+        self.assertEqual(values[0], ('Code', 'Gender', 'Date of Birth', 'Active'))
+        self.assertEqual(values[1], (1, 'Female', '19900131', True))
+        self.assertEqual(values[2], (2, 'Male', None, False))
+
+    def test_export_dict_rows(self):
+        rows = [{'code': 3, 'gender': 'Male', 'date_of_birth': None, 'active': True}]
+        fileobj = StaffExcelSerializer.export(rows, BytesIO())
+        values = list(load_workbook(fileobj).active.values)
+        self.assertEqual(values[1], (3, 'Male', None, True))
+
+    def test_exported_file_can_be_imported_back(self):
+        fileobj = StaffExcelSerializer.export(self.rows, BytesIO())
+        serializer = StaffExcelSerializer(load_workbook(fileobj).active)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertEqual(serializer.imported[0], {
+            'code': 1,
+            'gender': 'Female',
+            'date_of_birth': datetime.date(1990, 1, 31),
+            'active': True,
+        })
+        self.assertEqual(serializer.imported[1]['date_of_birth'], None)
+
+
+class TestExportResponse(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            (1, 'female', datetime.date(1990, 1, 31), True),
+            (2, 'MALE', None, False),
+        ]
+
+    def test_csv_response(self):
+        response = StaffExcelSerializer.export_response(self.rows, 'staff.csv', file_format='csv')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="staff.csv"')
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual(content.splitlines(), [
+            'Code,Gender,Date of Birth,Active',
+            '1,Female,19900131,True',
+            '2,Male,,False',
+        ])
+
+    def test_xlsx_response(self):
+        response = StaffExcelSerializer.export_response(self.rows, 'staff.xlsx')
+        content = BytesIO(b''.join(response.streaming_content))
+        values = list(load_workbook(content).active.values)
+        self.assertEqual(values[1], (1, 'Female', '19900131', True))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            StaffExcelSerializer.export_response(self.rows, 'staff.pdf', file_format='pdf')
+
+
+class TestErrorWorkbook(unittest.TestCase):
+    def test_invalid_cells_are_highlighted_and_commented(self):
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append(['Code', 'Gender', 'Date of Birth', 'Active'])
+        worksheet.append([1, 'Female', '19900131', True])
+        worksheet.append(['A', 'Other', '19900131', True])
+
+        serializer = StaffExcelSerializer(worksheet)
+        self.assertEqual(
+            [(record.row, record.column, record.field) for record in serializer.error_records],
+            [(3, 1, 'code'), (3, 2, 'gender')]
+        )
+
+        output = load_workbook(serializer.write_error_workbook(BytesIO())).active
+        self.assertEqual(list(output.values), list(worksheet.values))
+        self.assertIsNone(output['A2'].comment)
+        self.assertEqual(output['A3'].comment.text, serializer.validation_errors[0])
+        self.assertEqual(output['B3'].comment.text, serializer.validation_errors[1])
+        self.assertEqual(output['B3'].fill.fgColor.rgb, '00FFC7CE')
+
+
+class TestTemplate(unittest.TestCase):
+    def test_template(self):
+        fileobj = StaffExcelSerializer.build_template(BytesIO())
+        worksheet = load_workbook(fileobj).active
+        self.assertEqual(list(worksheet.values), [('Code', 'Gender', 'Date of Birth', 'Active')])
+        self.assertEqual(worksheet.column_dimensions['A'].number_format, '0')
+        self.assertEqual(worksheet.column_dimensions['B'].number_format, '@')
+        self.assertEqual(worksheet.column_dimensions['C'].number_format, 'yyyy-mm-dd')
+
+        validations = dict(
+            (str(validation.sqref), validation) for validation in worksheet.data_validations.dataValidation
+        )
+        self.assertEqual(validations['B2:B1048576'].type, 'list')
+        self.assertEqual(validations['B2:B1048576'].formula1, '"Male,Female"')
+
+    def test_template_is_cached(self):
+        first = StaffExcelSerializer.build_template(BytesIO()).getvalue()
+        second = StaffExcelSerializer.build_template(BytesIO()).getvalue()
+        self.assertEqual(first, second)
+        self.assertIs(StaffExcelSerializer._template_bytes, StaffExcelSerializer.__dict__['_template_bytes'])
+
+    def test_template_sample_rows_can_be_imported(self):
+        rows = [(1, 'Female', datetime.date(1990, 1, 31), True)]
+        fileobj = StaffExcelSerializer.build_template(BytesIO(), sample_rows=rows)
+        serializer = StaffExcelSerializer(load_workbook(fileobj).active)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertEqual(serializer.imported[0]['date_of_birth'], datetime.date(1990, 1, 31))
+
+    def test_long_choices_are_written_to_hidden_sheet(self):
+        class ShopExcelSerializer(serializers.ExcelSerializer):
+            shop = serializers.CharField(
+                max_length=20, verbose_name='Shop', choices=['Shop {}'.format(index) for index in range(100)]
+            )
+
+            class Meta:
+                start_index = 1
+                fields = ('shop',)
+                max_rows = 500
+
+        workbook = load_workbook(ShopExcelSerializer.build_template(BytesIO()))
+        choices = workbook['choices']
+        self.assertEqual(choices.sheet_state, 'hidden')
+        self.assertEqual(choices['A100'].value, 'Shop 99')
+        validation = workbook.worksheets[0].data_validations.dataValidation[0]
+        self.assertEqual(str(validation.sqref), 'A2:A501')
+        self.assertEqual(validation.formula1, "'choices'!$A$1:$A$100")
@@ -1,4 +1,8 @@
 from datetime import datetime
+from decimal import Decimal
+import os
+import subprocess
+import sys
 import unittest
 
 from django_excel_tools import fields
@@ -151,3 +155,239 @@ class DateTimeTest(unittest.TestCase):
         field.value = 20180101090000
         field.validate(index=0)
         self.assertEqual(field.cleaned_value, datetime(2018, 1, 1, 9))
+
+
+class DecimalFieldTest(unittest.TestCase):
+    def test_numeric_cell(self):
+        field = fields.DecimalField(verbose_name='field', decimal_places=2)
+        field.value = 0.1
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, Decimal('0.10'))
+
+        field.value = 10
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, Decimal('10.00'))
+
+    def test_separators(self):
+        field = fields.DecimalField(verbose_name='field')
+        field.value = '1,234.50'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, Decimal('1234.50'))
+
+        field = fields.DecimalField(verbose_name='field', decimal_separator=',')
+        field.value = '1.234,50'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, Decimal('1234.50'))
+
+    def test_other_separator_format(self):
+        field = fields.DecimalField(verbose_name='field', decimal_places=2)
+        for value in ['1.234,50', '1,5', '12,34,5', '1,234 567']:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+        field = fields.DecimalField(verbose_name='field', decimal_places=2, decimal_separator=',')
+        for value in ['1,234.50', '1.5', '1,2,3']:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+    def test_quantize(self):
+        field = fields.DecimalField(verbose_name='field', decimal_places=1)
+        field.value = '2.25'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, Decimal('2.3'))
+
+        field = fields.DecimalField(verbose_name='field', decimal_places=2)
+        for value, expected in [(1.5, '1.50'), (-3, '-3.00'), ('.5', '0.50'), ('1 000', '1000.00'), (1.005, '1.01')]:
+            field.value = value
+            field.validate(index=0)
+            self.assertEqual(str(field.cleaned_value), expected)
+
+    def test_max_digits(self):
+        field = fields.DecimalField(verbose_name='field', max_digits=4, decimal_places=2)
+        field.value = '12.345'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, Decimal('12.35'))
+
+        field.value = '123.4'
+        with self.assertRaises(fields.ValidationError):
+            field.validate(index=0)
+
+    def test_min_max_value(self):
+        field = fields.DecimalField(verbose_name='field', min_value=0, max_value=100)
+        for value in ['-1', '100.01']:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+    def test_invalid(self):
+        field = fields.DecimalField(verbose_name='field')
+        for value in ['hello', 'NaN', True]:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+    def test_too_many_digits_to_quantize(self):
+        field = fields.DecimalField(verbose_name='field', decimal_places=2)
+        for value in [1e30, '1e30', '1' * 40]:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+
+class FloatFieldTest(unittest.TestCase):
+    def test_convert(self):
+        field = fields.FloatField(verbose_name='field')
+        for value, expected in [(1.5, 1.5), (2, 2.0), ('1,234.5', 1234.5), (' 1 234.5 ', 1234.5)]:
+            field.value = value
+            field.validate(index=0)
+            self.assertEqual(field.cleaned_value, expected)
+
+    def test_decimal_separator(self):
+        field = fields.FloatField(verbose_name='field', decimal_separator=',')
+        field.value = '1.234,5'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, 1234.5)
+
+        for value in ['1,234.5', '1.5']:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+    def test_invalid(self):
+        field = fields.FloatField(verbose_name='field', max_value=10)
+        for value in ['hello', 'inf', 10.5, '1.234,5', '']:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+
+class RegexFieldTest(unittest.TestCase):
+    def test_match(self):
+        field = fields.RegexField(max_length=8, verbose_name='Postal Code', regex=r'\d{3}-\d{4}$')
+        field.value = '100-0001'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, '100-0001')
+
+        for value in ['1000001', '100-00012']:
+            field.value = value
+            with self.assertRaises(fields.ValidationError):
+                field.validate(index=0)
+
+    def test_transform(self):
+        field = fields.RegexField(
+            max_length=8,
+            verbose_name='SKU',
+            regex=r'[A-Z]{2}\d+$',
+            transform=lambda value: value.upper().replace('-', '')
+        )
+        field.value = 'ab-123'
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, 'AB123')
+
+    def test_transform_number(self):
+        field = fields.RegexField(
+            max_length=8, verbose_name='Code', regex=r'\d{4}$', transform=lambda value: value.zfill(4)
+        )
+        field.value = 12
+        field.validate(index=0)
+        self.assertEqual(field.cleaned_value, '0012')
+
+    def test_error_message(self):
+        field = fields.RegexField(
+            max_length=8, verbose_name='Code', regex=r'\d+$', error_message='"%(value)s" is not a code.'
+        )
+        field.value = 'abc'
+        with self.assertRaises(fields.ValidationError) as context:
+            field.validate(index=1)
+        self.assertEqual(context.exception.message, '[Row 1] Code "abc" is not a code.')
+
+    def test_email_and_slug(self):
+        email = fields.EmailField(verbose_name='Email', transform=str.lower)
+        email.value = 'Staff@Example.com'
+        email.validate(index=0)
+        self.assertEqual(email.cleaned_value, 'staff@example.com')
+
+        slug = fields.SlugField(verbose_name='Slug')
+        slug.value = 'not a slug'
+        with self.assertRaises(fields.ValidationError):
+            slug.validate(index=0)
+
+
+class FieldCacheTest(unittest.TestCase):
+    def test_cached_value_is_interned(self):
+        field = fields.CharField(max_length=10, verbose_name='Shop', cache=True)
+        cleaned = []
+        for value in [' Shop A', ''.join(['Shop', ' A '])]:
+            field.value = value
+            field.validate(index=1)
+            cleaned.append(field.cleaned_value)
+        field.value = ' Shop A'
+        field.validate(index=1)
+        self.assertIs(field.cleaned_value, cleaned[0])
+        self.assertIs(cleaned[0], cleaned[1])
+        self.assertEqual(cleaned[0], 'Shop A')
+
+    def test_type_is_part_of_key(self):
+        field = fields.CharField(max_length=10, verbose_name='Flag', cache=True)
+        for value, expected in [(1, '1'), (True, 'True'), (1.0, '1.0')]:
+            field.value = value
+            field.validate(index=1)
+            self.assertEqual(field.cleaned_value, expected)
+
+    def test_invalid_value_is_not_cached(self):
+        field = fields.CharField(max_length=10, verbose_name='Gender', choices=['Male', 'Female'], cache=True)
+        for index in range(2):
+            field.value = 'Other'
+            with self.assertRaises(fields.ValidationError) as context:
+                field.validate(index=index)
+            self.assertIn('[Row {}]'.format(index), context.exception.message)
+        self.assertEqual(field.cleaned_cache, {})
+
+    def test_cache_is_bounded(self):
+        field = fields.IntegerField(verbose_name='Code', cache=True)
+        for value in range(fields.FIELD_CACHE_SIZE + 1):
+            field.value = value
+            field.validate(index=1)
+        self.assertLessEqual(len(field.cleaned_cache), fields.FIELD_CACHE_SIZE)
+
+    def test_auto_cache(self):
+        low = fields.IntegerField(verbose_name='Status', cache='auto')
+        high = fields.IntegerField(verbose_name='Code', cache='auto')
+        for value in range(fields.FIELD_CACHE_PROBE_SIZE):
+            low.value = value % 3
+            low.validate(index=1)
+            high.value = value
+            high.validate(index=1)
+        self.assertEqual(len(low.cleaned_cache), 3)
+        self.assertIsNone(high.cleaned_cache)
+
+        high.value = '5'
+        high.validate(index=1)
+        self.assertEqual(high.cleaned_value, 5)
+
+    def test_duplicated_choices(self):
+        with self.assertRaises(fields.SerializerConfigError):
+            fields.CharField(max_length=1, verbose_name='Field', choices=['A', 'A'])
+
+
+class WithoutDjangoSettingsTest(unittest.TestCase):
+    def test_fields_validate_without_importing_django(self):
+        code = (
+            'import sys\n'
+            'from django_excel_tools import fields\n'
+            'field = fields.IntegerField(verbose_name="Code")\n'
+            'field.value = "A"\n'
+            'try:\n'
+            '    field.validate(index=2)\n'
+            'except fields.ValidationError as error:\n'
+            '    print(error.message)\n'
+            'print("django" in sys.modules)\n'
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+        self.assertEqual(
+            output.decode('utf-8').splitlines(),
+            ['[Row 2] Code cannot convert A to number.', 'False']
+        )
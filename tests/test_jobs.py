@@ -0,0 +1,239 @@
+import unittest
+
+from django.core.management import call_command
+from openpyxl import Workbook
+
+from django_excel_tools import serializers
+from django_excel_tools.jobs import Checkpoint, ImportJob, MemoryCheckpointStore, ModelCheckpointStore, run_in_thread
+from django_excel_tools.models import ImportCheckpoint
+
+
+class StaffSerializer(serializers.ExcelSerializer):
+    imported = []
+    fail_at = None
+
+    code = serializers.IntegerField(verbose_name='Code')
+    name = serializers.CharField(max_length=10, verbose_name='Name')
+
+    class Meta:
+        start_index = 1
+        fields = ('code', 'name')
+        chunk_size = 2
+
+    def import_operation(self, cleaned_data):
+        for row in cleaned_data:
+            if row['code'] == self.fail_at:
+                raise RuntimeError('Worker killed')
+        self.imported.extend(row['code'] for row in cleaned_data)
+
+
+def create_worksheet(codes):
+    worksheet = Workbook().active
+    worksheet.append(['Code', 'Name'])
+    for code in codes:
+        worksheet.append([code, 'Staff {}'.format(code)])
+    return worksheet
+
+
+class TestImportJob(unittest.TestCase):
+    def setUp(self):
+        StaffSerializer.imported = []
+        StaffSerializer.fail_at = None
+        self.store = MemoryCheckpointStore()
+
+    def test_import_in_chunks(self):
+        checkpoint = ImportJob(StaffSerializer, create_worksheet(range(1, 6)), 'job', store=self.store).run()
+        self.assertEqual(StaffSerializer.imported, [1, 2, 3, 4, 5])
+        self.assertEqual(checkpoint.status, Checkpoint.FINISHED)
+        self.assertEqual(checkpoint.last_row, 5)
+        self.assertEqual(checkpoint.imported_rows, 5)
+
+    def test_resume_from_checkpoint_without_reinserting(self):
+        worksheet = create_worksheet(range(1, 6))
+        StaffSerializer.fail_at = 4
+        with self.assertRaises(RuntimeError):
+            ImportJob(StaffSerializer, worksheet, 'job', store=self.store).run()
+        self.assertEqual(StaffSerializer.imported, [1, 2])
+        self.assertEqual(self.store.load('job').last_row, 2)
+
+        StaffSerializer.fail_at = None
+        checkpoint = ImportJob(StaffSerializer, worksheet, 'job', store=self.store).run()
+        self.assertEqual(StaffSerializer.imported, [1, 2, 3, 4, 5])
+        self.assertEqual(checkpoint.imported_rows, 5)
+
+        # Finished job is not imported again
+        ImportJob(StaffSerializer, worksheet, 'job', store=self.store).run()
+        self.assertEqual(StaffSerializer.imported, [1, 2, 3, 4, 5])
+
+    def test_stop_before_invalid_chunk(self):
+        worksheet = create_worksheet([1, 2, 3, 'A', 5])
+        checkpoint = ImportJob(StaffSerializer, worksheet, 'job', store=self.store).run()
+        self.assertEqual(StaffSerializer.imported, [1, 2])
+        self.assertEqual(checkpoint.status, Checkpoint.INVALID)
+        self.assertEqual(checkpoint.error_count, 1)
+        self.assertEqual(checkpoint.last_row, 2)
+
+    def test_unique_checked_across_resume_point(self):
+        class Serializer(StaffSerializer):
+            class Meta(StaffSerializer.Meta):
+                unique_fields = ('code',)
+
+        worksheet = create_worksheet([1, 2, 3, 4, 1])
+        StaffSerializer.fail_at = 3
+        with self.assertRaises(RuntimeError):
+            ImportJob(Serializer, worksheet, 'job', store=self.store).run()
+
+        StaffSerializer.fail_at = None
+        job = ImportJob(Serializer, worksheet, 'job', store=self.store)
+        checkpoint = job.run()
+        self.assertEqual(checkpoint.status, Checkpoint.INVALID)
+        self.assertEqual(job.serializer.validation_errors, ['[Row 6] Code is duplicated with row 2.'])
+        self.assertEqual(StaffSerializer.imported, [1, 2])
+
+    def test_partial_import_keeps_unique_index_before_resume_point(self):
+        class Serializer(StaffSerializer):
+            class Meta(StaffSerializer.Meta):
+                unique_fields = ('code',)
+                partial_import = True
+
+        worksheet = create_worksheet([1, 2, 3, 4, 1, 6])
+        StaffSerializer.fail_at = 3
+        with self.assertRaises(RuntimeError):
+            ImportJob(Serializer, worksheet, 'job', store=self.store).run()
+
+        StaffSerializer.fail_at = None
+        job = ImportJob(Serializer, worksheet, 'job', store=self.store)
+        checkpoint = job.run()
+        self.assertEqual(checkpoint.status, Checkpoint.FINISHED)
+        self.assertEqual(StaffSerializer.imported, [1, 2, 3, 4, 6])
+        self.assertEqual(job.serializer.quarantined_rows, 1)
+
+    def test_max_rows_checked_before_import(self):
+        class Serializer(StaffSerializer):
+            class Meta(StaffSerializer.Meta):
+                max_rows = 4
+
+        worksheet = create_worksheet(range(1, 6))
+        for _run in range(2):
+            checkpoint = ImportJob(Serializer, worksheet, 'job', store=self.store).run()
+            self.assertEqual(checkpoint.status, Checkpoint.INVALID)
+        self.assertEqual(StaffSerializer.imported, [])
+
+    def test_lock_held_only_while_importing(self):
+        events = []
+
+        class Lock(object):
+            def __enter__(self):
+                events.append('lock')
+
+            def __exit__(self, *args):
+                events.append('unlock')
+
+        class Serializer(StaffSerializer):
+            def row_extra_validation(self, index, cleaned_row):
+                events.append('validate')
+
+            def import_operation(self, cleaned_data):
+                events.append('import')
+
+        ImportJob(Serializer, create_worksheet(range(1, 4)), 'job', store=self.store, lock=Lock()).run()
+        self.assertEqual(events, [
+            'validate', 'validate', 'lock', 'import', 'unlock', 'validate', 'lock', 'import', 'unlock'
+        ])
+
+    def test_max_errors(self):
+        worksheet = create_worksheet(['A', 'B', 'C', 'D'])
+        job = ImportJob(StaffSerializer, worksheet, 'job', store=self.store, chunk_size=10, max_errors=2)
+        checkpoint = job.run()
+        self.assertEqual(checkpoint.status, Checkpoint.INVALID)
+        self.assertEqual(len(job.serializer.validation_errors), 2)
+
+    def test_run_in_thread(self):
+        job = ImportJob(StaffSerializer, create_worksheet(range(1, 4)), 'job', store=self.store)
+        run_in_thread(job).join()
+        self.assertEqual(StaffSerializer.imported, [1, 2, 3])
+        self.assertEqual(job.checkpoint.status, Checkpoint.FINISHED)
+
+
+class TestModelCheckpointStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', 'django_excel_tools', verbosity=0)
+
+    def setUp(self):
+        StaffSerializer.imported = []
+        StaffSerializer.fail_at = None
+        ImportCheckpoint.objects.all().delete()
+
+    def test_checkpoint_saved_with_chunk(self):
+        worksheet = create_worksheet(range(1, 6))
+        StaffSerializer.fail_at = 3
+        with self.assertRaises(RuntimeError):
+            ImportJob(StaffSerializer, worksheet, 'job').run()
+        instance = ImportCheckpoint.objects.get(job_id='job')
+        self.assertEqual((instance.status, instance.last_row, instance.imported_rows), ('running', 2, 2))
+
+        StaffSerializer.fail_at = None
+        ImportJob(StaffSerializer, worksheet, 'job', store=ModelCheckpointStore()).run()
+        instance.refresh_from_db()
+        self.assertEqual(instance.status, Checkpoint.FINISHED)
+        self.assertEqual(StaffSerializer.imported, [1, 2, 3, 4, 5])
+
+
+class JobSerializer(serializers.ExcelSerializer):
+    """
+    Imports each row as an ImportCheckpoint, so imported rows are found by
+    the unique check against the database
+    """
+    fail_at = None
+
+    job_id = serializers.CharField(max_length=10, verbose_name='Job')
+
+    class Meta:
+        start_index = 1
+        fields = ('job_id',)
+        unique_fields = ('job_id',)
+        chunk_size = 2
+
+    def import_operation(self, cleaned_data):
+        for row in cleaned_data:
+            if row['job_id'] == self.fail_at:
+                raise RuntimeError('Worker killed')
+            ImportCheckpoint.objects.create(job_id=row['job_id'])
+
+    def get_unique_queryset(self):
+        return ImportCheckpoint.objects.filter(job_id__startswith='staff-')
+
+
+class TestResumeWithUniqueQueryset(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', 'django_excel_tools', verbosity=0)
+
+    def setUp(self):
+        JobSerializer.fail_at = None
+        ImportCheckpoint.objects.all().delete()
+
+    def test_committed_rows_are_not_checked_against_database(self):
+        worksheet = Workbook().active
+        worksheet.append(['Job'])
+        for code in range(1, 6):
+            worksheet.append(['staff-{}'.format(code)])
+        store = MemoryCheckpointStore()
+
+        JobSerializer.fail_at = 'staff-3'
+        with self.assertRaises(RuntimeError):
+            ImportJob(JobSerializer, worksheet, 'job', store=store).run()
+        self.assertEqual(store.load('job').last_row, 2)
+
+        JobSerializer.fail_at = None
+        job = ImportJob(JobSerializer, worksheet, 'job', store=store)
+        checkpoint = job.run()
+        self.assertEqual(job.serializer.validation_errors, [])
+        self.assertEqual(checkpoint.status, Checkpoint.FINISHED)
+        self.assertEqual(ImportCheckpoint.objects.filter(job_id__startswith='staff-').count(), 5)
+
+        # Rows after the resume point are still checked
+        worksheet.append(['staff-1'])
+        checkpoint = ImportJob(JobSerializer, worksheet, 'other', store=store).run()
+        self.assertEqual(checkpoint.status, Checkpoint.INVALID)
@@ -0,0 +1,75 @@
+import unittest
+from io import BytesIO
+
+from openpyxl import Workbook, load_workbook
+
+from django_excel_tools import serializers
+
+
+class ShopExcelSerializer(serializers.ExcelSerializer):
+    code = serializers.IntegerField(verbose_name='Code')
+    name = serializers.CharField(max_length=10, verbose_name='Name')
+
+    class Meta:
+        start_index = 1
+        fields = ('code', 'name')
+
+    def import_operation(self, cleaned_data):
+        raise AssertionError('preview must not import')
+
+
+def create_workbook(rows):
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(['Code', 'Name'])
+    for index in range(rows):
+        # Every tenth row has an invalid code
+        code = 'X' if index % 10 == 9 else index
+        worksheet.append([code, 'Shop {}'.format(index % 3)])
+    return workbook
+
+
+class TestPreview(unittest.TestCase):
+    def test_small_file_is_validated_completely(self):
+        preview = ShopExcelSerializer.preview(create_workbook(20).active)
+        self.assertTrue(preview.complete)
+        self.assertTrue(preview.is_valid_template)
+        self.assertEqual(preview.estimated_rows, 20)
+        self.assertEqual(preview.validated_rows, 20)
+        self.assertEqual(preview.projected_invalid_rows, 2)
+        self.assertEqual(len(preview.errors), 2)
+
+    def test_sample_is_projected(self):
+        preview = ShopExcelSerializer.preview(create_workbook(1000).active, head=50, sample=50, seed=1)
+        self.assertFalse(preview.complete)
+        self.assertEqual(preview.estimated_rows, 1000)
+        self.assertEqual(preview.validated_rows, 100)
+        self.assertAlmostEqual(preview.error_rate, 0.1, delta=0.06)
+        self.assertGreater(preview.projected_invalid_rows, preview.invalid_rows)
+        self.assertGreater(preview.estimated_seconds, 0)
+        self.assertGreater(preview.estimated_memory, 0)
+
+    def test_read_only_worksheet(self):
+        fileobj = BytesIO()
+        create_workbook(300).save(fileobj)
+        fileobj.seek(0)
+        worksheet = load_workbook(fileobj, read_only=True).active
+        preview = ShopExcelSerializer.preview(worksheet, head=10, sample=20, seed=1)
+        self.assertEqual(preview.validated_rows, 30)
+        self.assertEqual(preview.estimated_rows, 300)
+
+    def test_wrong_template(self):
+        workbook = Workbook()
+        workbook.active.append(['Code'])
+        preview = ShopExcelSerializer.preview(workbook.active)
+        self.assertFalse(preview.is_valid_template)
+        self.assertEqual(preview.validated_rows, 0)
+        self.assertEqual(preview.errors, preview.template_errors)
+
+    def test_formatted_empty_tail_is_not_counted(self):
+        workbook = create_workbook(200)
+        workbook.active.cell(row=100000, column=1).number_format = '0.00'
+        preview = ShopExcelSerializer.preview(workbook.active, seed=1)
+        self.assertEqual(workbook.active.max_row, 100000)
+        self.assertLess(preview.estimated_rows, 1000)
+        self.assertLess(preview.projected_invalid_rows, 100)
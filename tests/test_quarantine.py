@@ -0,0 +1,141 @@
+import json
+import unittest
+from io import StringIO
+
+from django.core.management import call_command
+from openpyxl import Workbook
+
+from django_excel_tools import exceptions, serializers
+from django_excel_tools.jobs import Checkpoint, ImportJob, MemoryCheckpointStore
+from django_excel_tools.models import QuarantinedRow
+from django_excel_tools.quarantine import CallbackQuarantine, CSVQuarantine, ModelQuarantine
+
+
+class FeedExcelSerializer(serializers.ExcelSerializer):
+    code = serializers.IntegerField(verbose_name='Code')
+    name = serializers.CharField(max_length=5, verbose_name='Name')
+
+    class Meta:
+        start_index = 1
+        fields = ('code', 'name')
+        partial_import = True
+        chunk_size = 2
+
+    def validate_chunk(self, rows):
+        return dict((index, 'Code 13 is reserved.') for index, row in rows if row['code'] == 13)
+
+    def import_operation(self, cleaned_data):
+        self.imported = list(cleaned_data)
+
+
+class TestPartialImport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', 'django_excel_tools', verbosity=0)
+
+    def setUp(self):
+        self.workbook = Workbook()
+        self.worksheet = self.workbook.active
+        self.worksheet.append(['Code', 'Name'])
+        for row in [[1, 'A'], ['X', 'B'], [13, 'C'], [4, 'Too long'], [5, 'E']]:
+            self.worksheet.append(row)
+
+    def test_valid_rows_are_imported(self):
+        serializer = FeedExcelSerializer(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertEqual([row['code'] for row in serializer.imported], [1, 5])
+        self.assertEqual(serializer.quarantined_rows, 3)
+        self.assertEqual(
+            [(row, values) for row, values, errors in serializer.quarantine.rows],
+            [(3, ('X', 'B')), (4, (13, 'C')), (5, (4, 'Too long'))]
+        )
+        self.assertEqual(serializer.quarantine.rows[1][2], ['[Row 4] Code 13 is reserved.'])
+
+    def test_without_partial_import(self):
+        class Serializer(FeedExcelSerializer):
+            class Meta(FeedExcelSerializer.Meta):
+                partial_import = False
+
+        serializer = Serializer(self.worksheet)
+        self.assertEqual(len(serializer.validation_errors), 3)
+        self.assertFalse(hasattr(serializer, 'imported'))
+
+    def test_sheet_errors_still_block_import(self):
+        class Serializer(FeedExcelSerializer):
+            class Meta(FeedExcelSerializer.Meta):
+                max_rows = 2
+                stop_after_blank_rows = None
+
+        serializer = Serializer(self.worksheet)
+        self.assertEqual(serializer.validation_errors, ['This import allows at most 2 rows.'])
+        self.assertFalse(hasattr(serializer, 'imported'))
+
+    def test_csv_quarantine(self):
+        output = StringIO()
+        FeedExcelSerializer(self.worksheet, quarantine=CSVQuarantine(output, header=['Code', 'Name']))
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], 'row,Code,Name,errors')
+        self.assertTrue(lines[1].startswith('3,X,B,'))
+
+    def test_callback_quarantine(self):
+        rows = []
+        FeedExcelSerializer(self.worksheet, quarantine=CallbackQuarantine(lambda *args: rows.append(args)))
+        self.assertEqual([row for row, values, errors in rows], [3, 4, 5])
+
+    def test_model_quarantine(self):
+        QuarantinedRow.objects.all().delete()
+        FeedExcelSerializer(self.worksheet, quarantine=ModelQuarantine('feed.xlsx', batch_size=2))
+        rows = QuarantinedRow.objects.filter(source='feed.xlsx').order_by('row')
+        self.assertEqual([row.row for row in rows], [3, 4, 5])
+        self.assertEqual(json.loads(rows[0].values), ['X', 'B'])
+
+    def test_failed_import_quarantines_nothing(self):
+        QuarantinedRow.objects.all().delete()
+
+        class Serializer(FeedExcelSerializer):
+            def import_operation(self, cleaned_data):
+                raise exceptions.ImportOperationFailed
+
+        class WithoutTransaction(Serializer):
+            class Meta(FeedExcelSerializer.Meta):
+                enable_transaction = False
+
+        for serializer_class in [Serializer, WithoutTransaction]:
+            serializer = serializer_class(self.worksheet, quarantine=ModelQuarantine('feed.xlsx', batch_size=1))
+            self.assertEqual(serializer.quarantined_rows, 3)
+            self.assertEqual(QuarantinedRow.objects.filter(source='feed.xlsx').count(), 0)
+
+    def test_import_job(self):
+        imported = []
+
+        class Serializer(FeedExcelSerializer):
+            def import_operation(self, cleaned_data):
+                imported.extend(cleaned_data)
+
+        job = ImportJob(Serializer, self.worksheet, 'feed', store=MemoryCheckpointStore())
+        checkpoint = job.run()
+        self.assertEqual(checkpoint.status, Checkpoint.FINISHED)
+        self.assertEqual([row['code'] for row in imported], [1, 5])
+        self.assertEqual(checkpoint.error_count, 3)
+        self.assertEqual(job.serializer.quarantined_rows, 3)
+
+    def test_import_job_resume_does_not_quarantine_twice(self):
+        QuarantinedRow.objects.all().delete()
+        fail = [True]
+
+        class Serializer(FeedExcelSerializer):
+            def import_operation(self, cleaned_data):
+                if fail[0]:
+                    raise RuntimeError('Worker killed')
+
+        store = MemoryCheckpointStore()
+        with self.assertRaises(RuntimeError):
+            quarantine = ModelQuarantine('feed', batch_size=1)
+            ImportJob(Serializer, self.worksheet, 'feed', store=store, quarantine=quarantine).run()
+        self.assertEqual(QuarantinedRow.objects.filter(source='feed').count(), 0)
+
+        fail[0] = False
+        quarantine = ModelQuarantine('feed', batch_size=1)
+        ImportJob(Serializer, self.worksheet, 'feed', store=store, quarantine=quarantine).run()
+        rows = QuarantinedRow.objects.filter(source='feed').order_by('row')
+        self.assertEqual([row.row for row in rows], [3, 4, 5])
@@ -0,0 +1,71 @@
+import json
+import re
+import unittest
+
+from django_excel_tools import serializers
+
+
+class ProductExcelSerializer(serializers.ExcelSerializer):
+    sku = serializers.RegexField(max_length=8, verbose_name='SKU', regex=r'[A-Z]{2}\d+$')
+    size = serializers.CharField(max_length=2, verbose_name='Size', choices=['S', 'M', 'L'])
+    quantity = serializers.IntegerField(verbose_name='Quantity', blank=True, default=0)
+    price = serializers.DecimalField(verbose_name='Price', decimal_places=2, min_value=0)
+    released = serializers.DateField(
+        verbose_name='Released', date_format='%Y-%m-%d', date_format_verbose='YYYY-MM-DD', blank=True
+    )
+    email = serializers.EmailField(verbose_name='Contact')
+
+    class Meta:
+        start_index = 1
+        fields = ('sku', 'size', 'quantity', 'price', 'released', 'email')
+        unique_fields = ('sku',)
+        max_rows = 1000
+
+
+class TestSchema(unittest.TestCase):
+    def test_schema(self):
+        schema = ProductExcelSerializer.get_schema()
+        self.assertEqual([spec['name'] for spec in schema['fields']], list(ProductExcelSerializer.Meta.fields))
+        self.assertEqual(schema['unique_checks'], [['sku']])
+        sku, size, quantity, price, released, email = schema['fields']
+        self.assertEqual(sku['type'], 'regex')
+        self.assertEqual(sku['regex'], r'[A-Z]{2}\d+$')
+        self.assertEqual(size['choices'], ['S', 'M', 'L'])
+        self.assertEqual((quantity['blank'], quantity['default']), (True, 0))
+        self.assertEqual((price['decimal_places'], price['min_value']), (2, 0))
+        self.assertEqual(released['date_format'], '%Y-%m-%d')
+        self.assertEqual(email['type'], 'email')
+        json.dumps(schema)
+
+    def test_schema_is_cached_per_class(self):
+        self.assertIs(ProductExcelSerializer.get_schema(), ProductExcelSerializer.get_schema())
+        self.assertIs(ProductExcelSerializer.get_json_schema(), ProductExcelSerializer.get_json_schema())
+
+        class Subclass(ProductExcelSerializer):
+            class Meta(ProductExcelSerializer.Meta):
+                fields = ('sku',)
+
+        self.assertEqual(len(Subclass.get_schema()['fields']), 1)
+
+    def test_json_schema(self):
+        schema = ProductExcelSerializer.get_json_schema()
+        self.assertEqual(schema['maxItems'], 1000)
+        items = schema['items']
+        self.assertEqual(list(items['properties']), list(ProductExcelSerializer.Meta.fields))
+        self.assertEqual(items['required'], ['sku', 'size', 'price', 'email'])
+        properties = items['properties']
+        self.assertEqual(properties['sku']['pattern'], r'^[A-Z]{2}\d+$')
+        self.assertEqual(properties['size']['enum'], ['S', 'M', 'L'])
+        self.assertEqual(properties['quantity']['type'], ['integer', 'null'])
+        self.assertEqual(properties['price']['minimum'], 0)
+        self.assertEqual(properties['released']['format'], 'date')
+        self.assertEqual(properties['email']['format'], 'email')
+        json.dumps(schema)
+
+    def test_json_pattern_is_ecma_compatible(self):
+        slug = serializers.SlugField(verbose_name='Slug')
+        self.assertEqual(slug.get_json_schema()['pattern'], '^[-a-zA-Z0-9_]+$')
+
+        for regex, flags in [(r'(?P<code>\d+)\Z', 0), (r'[a-z]+$', re.IGNORECASE)]:
+            field = serializers.RegexField(max_length=8, verbose_name='Code', regex=regex, flags=flags)
+            self.assertNotIn('pattern', field.get_json_schema())
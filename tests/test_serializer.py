@@ -1,10 +1,14 @@
 import unittest
 from unittest import skip
 
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from openpyxl import Workbook
 
 from django_excel_tools import serializers
 from django_excel_tools.exceptions import FieldNotExist, ValidationError
+from django_excel_tools.models import ImportCheckpoint
 from django_excel_tools.serializers import SerializerMeta
 
 
@@ -262,3 +266,369 @@ class TestSerializer(unittest.TestCase):
         self.assertEqual(serializer.validation_errors, [])
         self.assertEqual(serializer.cleaned_data[0]['field_name_2'], expected_value)
         self.assertEqual(serializer.cleaned_data[1]['field_name_2'], expected_value)
+
+    def test_enable_transaction_wraps_import_in_atomic(self):
+        in_atomic_block = []
+
+        class Serializer(serializers.ExcelSerializer):
+            field_name_1 = serializers.CharField(max_length=10,
+                                                 verbose_name='Field name 1')
+            field_name_2 = serializers.CharField(max_length=10,
+                                                 verbose_name='Field name 2')
+
+            class Meta:
+                start_index = 1
+                fields = ('field_name_1', 'field_name_2')
+
+            def import_operation(self, cleaned_data):
+                in_atomic_block.append(connection.in_atomic_block)
+
+        class NoTransactionSerializer(Serializer):
+
+            class Meta:
+                start_index = 1
+                fields = ('field_name_1', 'field_name_2')
+                enable_transaction = False
+
+        Serializer(self.worksheet)
+        NoTransactionSerializer(self.worksheet)
+        self.assertEqual(in_atomic_block, [True, False])
+
+
+class TestUniqueValidation(unittest.TestCase):
+    def setUp(self):
+        workbook = Workbook()
+        self.worksheet = workbook.active
+        self.worksheet.append(['Shop', 'Order Number'])
+        self.worksheet.append(['Shop A', '001'])
+        self.worksheet.append(['Shop B', '001'])
+        self.worksheet.append(['Shop A', '002'])
+        self.worksheet.append(['Shop A', '001'])
+
+    def test_unique_fields(self):
+        class Serializer(serializers.ExcelSerializer):
+            shop = serializers.CharField(max_length=10, verbose_name='Shop')
+            order_number = serializers.CharField(max_length=10, verbose_name='Order Number')
+
+            class Meta:
+                start_index = 1
+                fields = ('shop', 'order_number')
+                unique_fields = ('order_number',)
+
+        serializer = Serializer(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [
+            '[Row 3] Order Number is duplicated with row 2.',
+            '[Row 5] Order Number is duplicated with row 2.',
+        ])
+        self.assertEqual(serializer.error_records[0].column, 2)
+
+    def test_unique_together(self):
+        class Serializer(serializers.ExcelSerializer):
+            shop = serializers.CharField(max_length=10, verbose_name='Shop')
+            order_number = serializers.CharField(max_length=10, verbose_name='Order Number')
+
+            class Meta:
+                start_index = 1
+                fields = ('shop', 'order_number')
+                unique_together = (('shop', 'order_number'),)
+
+        serializer = Serializer(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [
+            '[Row 5] Shop, Order Number is duplicated with row 2.',
+        ])
+
+    def test_unique_field_must_be_in_fields(self):
+        class Serializer(serializers.ExcelSerializer):
+            shop = serializers.CharField(max_length=10, verbose_name='Shop')
+
+            class Meta:
+                start_index = 1
+                fields = ('shop',)
+                unique_fields = ('order_number',)
+
+        with self.assertRaises(AssertionError):
+            Serializer(self.worksheet)
+
+
+class TestUniqueInDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', 'django_excel_tools', verbosity=0)
+
+    def setUp(self):
+        ImportCheckpoint.objects.all().delete()
+        ImportCheckpoint.objects.create(job_id='job-2', status='finished')
+        ImportCheckpoint.objects.create(job_id='job-4', status='finished')
+
+    def test_unique_checked_in_batched_queries(self):
+        class Serializer(serializers.ExcelSerializer):
+            job_id = serializers.CharField(max_length=10, verbose_name='Job')
+            status = serializers.CharField(max_length=10, verbose_name='Status')
+
+            class Meta:
+                start_index = 1
+                fields = ('job_id', 'status')
+                unique_fields = ('job_id',)
+                chunk_size = 3
+
+            def get_unique_queryset(self):
+                return ImportCheckpoint.objects.all()
+
+        worksheet = Workbook().active
+        worksheet.append(['Job', 'Status'])
+        for index in range(1, 6):
+            worksheet.append(['job-{}'.format(index), 'running'])
+
+        with CaptureQueriesContext(connection) as context:
+            serializer = Serializer(worksheet)
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual(serializer.validation_errors, [
+            '[Row 3] Job already exists.',
+            '[Row 5] Job already exists.',
+        ])
+
+    def test_unique_together_keys_queried_in_batches(self):
+        class Serializer(serializers.ExcelSerializer):
+            job_id = serializers.CharField(max_length=10, verbose_name='Job')
+            status = serializers.CharField(max_length=10, verbose_name='Status')
+
+            class Meta:
+                start_index = 1
+                fields = ('job_id', 'status')
+                unique_together = (('job_id', 'status'),)
+
+            def get_unique_queryset(self):
+                return ImportCheckpoint.objects.all()
+
+        worksheet = Workbook().active
+        worksheet.append(['Job', 'Status'])
+        for index in range(1, 1001):
+            worksheet.append(['job-{}'.format(index), 'finished'])
+
+        with CaptureQueriesContext(connection) as context:
+            serializer = Serializer(worksheet)
+        self.assertEqual(len(context.captured_queries), 5)
+        self.assertEqual(serializer.validation_errors, [
+            '[Row 3] Job, Status already exists.',
+            '[Row 5] Job, Status already exists.',
+        ])
+
+
+class TestValidateChunk(unittest.TestCase):
+    def test_errors_mapped_to_rows(self):
+        chunks = []
+
+        class Serializer(serializers.ExcelSerializer):
+            code = serializers.IntegerField(verbose_name='Code')
+
+            class Meta:
+                start_index = 1
+                fields = ('code',)
+                chunk_size = 2
+
+            def validate_chunk(self, rows):
+                chunks.append([index for index, cleaned_row in rows])
+                return dict(
+                    (index, 'Code {} does not exist.'.format(cleaned_row['code']))
+                    for index, cleaned_row in rows if cleaned_row['code'] > 2
+                )
+
+        worksheet = Workbook().active
+        worksheet.append(['Code'])
+        for code in [1, 'A', 2, 3, 4]:
+            worksheet.append([code])
+
+        serializer = Serializer(worksheet)
+        self.assertEqual(chunks, [[1, 3], [4, 5]])
+        self.assertEqual(serializer.validation_errors, [
+            '[Row 3] Code cannot convert A to number.',
+            '[Row 5] Code 3 does not exist.',
+            '[Row 6] Code 4 does not exist.',
+        ])
+
+    def test_duplicate_of_rejected_row_is_accepted(self):
+        class Serializer(serializers.ExcelSerializer):
+            code = serializers.IntegerField(verbose_name='Code')
+            name = serializers.CharField(max_length=10, verbose_name='Name')
+
+            class Meta:
+                start_index = 1
+                fields = ('code', 'name')
+                unique_fields = ('code',)
+                partial_import = True
+
+            def validate_chunk(self, rows):
+                return dict(
+                    (index, 'Name is not allowed.')
+                    for index, cleaned_row in rows if cleaned_row['name'] == 'Old'
+                )
+
+        worksheet = Workbook().active
+        worksheet.append(['Code', 'Name'])
+        worksheet.append([1, 'Old'])
+        worksheet.append([1, 'New'])
+        worksheet.append([1, 'Newer'])
+
+        serializer = Serializer(worksheet)
+        self.assertEqual(serializer.cleaned_data, [{'code': 1, 'name': 'New'}])
+        self.assertEqual([row for row, values, errors in serializer.quarantine.rows], [2, 4])
+        self.assertEqual(serializer.quarantine.rows[1][2], ['[Row 4] Code is duplicated with row 3.'])
+
+
+class TestRowType(unittest.TestCase):
+    def setUp(self):
+        self.worksheet = Workbook().active
+        self.worksheet.append(['Code', 'Name'])
+        self.worksheet.append([1, 'Staff 1'])
+        self.worksheet.append([2, 'Staff 2'])
+
+    def get_serializer_class(self, row_type):
+        class Serializer(serializers.ExcelSerializer):
+            code = serializers.IntegerField(verbose_name='Code')
+            name = serializers.CharField(max_length=10, verbose_name='Name')
+
+            class Meta:
+                start_index = 1
+                fields = ('code', 'name')
+                unique_fields = ('code',)
+
+        Serializer.Meta.row_type = row_type
+        return Serializer
+
+    def test_record(self):
+        serializer = self.get_serializer_class('record')(self.worksheet)
+        row = serializer.cleaned_data[0]
+        self.assertEqual(row['name'], 'Staff 1')
+        self.assertEqual(row[0], 1)
+        self.assertEqual(dict(**row), {'code': 1, 'name': 'Staff 1'})
+        self.assertEqual(row.get('missing', 'default'), 'default')
+        self.assertTrue('code' in row)
+        self.assertFalse(hasattr(row, '__dict__'))
+        self.assertIs(type(serializer.cleaned_data[1]), type(row))
+
+    def test_tuple(self):
+        serializer = self.get_serializer_class('tuple')(self.worksheet)
+        self.assertEqual(serializer.cleaned_data, [(1, 'Staff 1'), (2, 'Staff 2')])
+        self.assertEqual(serializer.row_header, {'code': 0, 'name': 1})
+
+    def test_unknown_row_type(self):
+        with self.assertRaises(AssertionError):
+            self.get_serializer_class('list')(self.worksheet)
+
+
+class TestEndOfData(unittest.TestCase):
+    def setUp(self):
+        self.worksheet = Workbook().active
+        self.worksheet.append(['Code'])
+        self.worksheet.append([1])
+        self.worksheet.append(['  '])
+        self.worksheet.append([2])
+        self.worksheet.append([None])
+        self.worksheet.append([None])
+        self.worksheet.append([3])
+
+    def get_serializer_class(self, **options):
+        class Serializer(serializers.ExcelSerializer):
+            code = serializers.IntegerField(verbose_name='Code')
+
+            class Meta:
+                start_index = 1
+                fields = ('code',)
+
+        for name, value in options.items():
+            setattr(Serializer.Meta, name, value)
+        return Serializer
+
+    def test_stop_at_first_blank_row_by_default(self):
+        serializer = self.get_serializer_class()(self.worksheet)
+        self.assertEqual(serializer.cleaned_data, [{'code': 1}])
+
+    def test_skip_blank_rows_in_the_middle(self):
+        serializer = self.get_serializer_class(stop_after_blank_rows=2)(self.worksheet)
+        self.assertEqual(serializer.cleaned_data, [{'code': 1}, {'code': 2}])
+
+        serializer = self.get_serializer_class(stop_after_blank_rows=None)(self.worksheet)
+        self.assertEqual(serializer.cleaned_data, [{'code': 1}, {'code': 2}, {'code': 3}])
+
+    def test_formatted_empty_tail_is_not_read(self):
+        self.worksheet.cell(row=1048576, column=1).number_format = '0.00'
+        self.assertEqual(self.worksheet.max_row, 1048576)
+        serializer = self.get_serializer_class(stop_after_blank_rows=3)(self.worksheet)
+        self.assertEqual(len(serializer.cleaned_data), 3)
+
+    def test_max_rows(self):
+        serializer = self.get_serializer_class(max_rows=2, stop_after_blank_rows=None)(self.worksheet)
+        self.assertEqual(serializer.validation_errors, ['This import allows at most 2 rows.'])
+
+        serializer = self.get_serializer_class(max_rows=3, stop_after_blank_rows=None)(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertEqual(len(serializer.cleaned_data), 3)
+
+
+class TestHeaderCheck(unittest.TestCase):
+    def setUp(self):
+        self.imported = []
+        self.workbook = Workbook()
+        self.worksheet = self.workbook.active
+        self.worksheet.append([' order  number ', 'SHOP'])
+        self.worksheet.append([1, 'Shop A'])
+
+    def get_serializer_class(self, **options):
+        imported = self.imported
+
+        class Serializer(serializers.ExcelSerializer):
+            order_number = serializers.IntegerField(verbose_name='Order Number')
+            shop = serializers.CharField(max_length=10, verbose_name='Shop Name')
+
+            class Meta:
+                start_index = 1
+                fields = ('order_number', 'shop')
+
+            def import_operation(self, cleaned_data):
+                imported.extend(cleaned_data)
+
+        for name, value in options.items():
+            setattr(Serializer.Meta, name, value)
+        return Serializer
+
+    def test_header_is_not_checked_by_default(self):
+        serializer = self.get_serializer_class()(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [])
+
+    def test_wrong_header_is_rejected_before_rows(self):
+        self.worksheet.append(['X', 'Shop B'])
+        serializer = self.get_serializer_class(check_header=True)(self.worksheet)
+        self.assertEqual(
+            serializer.validation_errors,
+            ['Column 2 must be "Shop Name" but it is "SHOP".']
+        )
+        self.assertEqual(serializer.error_records[0].row, 1)
+        self.assertEqual(self.imported, [])
+
+    def test_aliases(self):
+        serializer = self.get_serializer_class(
+            check_header=True, header_aliases={'shop': ['Shop', 'Store']}
+        )(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertEqual(len(self.imported), 1)
+
+    def test_fingerprint(self):
+        serializer_class = self.get_serializer_class()
+        serializer_class.Meta.header_fingerprint = serializer_class.get_header_fingerprint()
+        serializer = serializer_class(self.worksheet)
+        self.assertEqual(len(serializer.validation_errors), 1)
+
+        self.worksheet['B1'] = 'shop name'
+        serializer = serializer_class(self.worksheet)
+        self.assertEqual(serializer.validation_errors, [])
+
+    def test_fingerprint_mismatch_with_valid_names(self):
+        serializer_class = self.get_serializer_class(
+            header_aliases={'shop': ['Shop']}, header_fingerprint='0' * 40
+        )
+        serializer = serializer_class(self.worksheet)
+        self.assertEqual(serializer.validation_errors, ['This excel does not match the import template.'])
+
+    def test_header_index_must_be_before_data(self):
+        with self.assertRaises(AssertionError):
+            self.get_serializer_class(check_header=True, start_index=0)(self.worksheet)
@@ -0,0 +1,85 @@
+import os
+import unittest
+from io import BytesIO
+
+from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
+from openpyxl import Workbook, load_workbook
+
+from django_excel_tools import serializers
+from django_excel_tools.uploads import get_file_source, open_worksheet, opened_workbook
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+class CodeExcelSerializer(serializers.ExcelSerializer):
+    code = serializers.IntegerField(verbose_name='Code')
+
+    class Meta:
+        start_index = 1
+        fields = ('code',)
+
+    def import_operation(self, cleaned_data):
+        self.imported = cleaned_data
+
+
+def create_content(codes=(1, 2)):
+    workbook = Workbook()
+    workbook.active.append(['Code'])
+    for code in codes:
+        workbook.active.append([code])
+    fileobj = BytesIO()
+    workbook.save(fileobj)
+    return fileobj.getvalue()
+
+
+class TestUploads(unittest.TestCase):
+    def setUp(self):
+        self.content = create_content()
+
+    def test_in_memory_upload_is_not_copied(self):
+        fileobj = BytesIO(self.content)
+        fileobj.read()
+        upload = InMemoryUploadedFile(
+            fileobj, 'file', 'codes.xlsx', XLSX_CONTENT_TYPE, len(self.content), None
+        )
+        self.assertIs(get_file_source(upload), fileobj)
+        serializer = CodeExcelSerializer.from_file(upload)
+        self.assertEqual(serializer.imported, [{'code': 1}, {'code': 2}])
+        # The archive is closed, the upload buffer stays open
+        self.assertIsNone(serializer.worksheet.parent._archive.fp)
+        self.assertFalse(fileobj.closed)
+
+    def test_temporary_upload_is_read_from_disk(self):
+        upload = TemporaryUploadedFile('codes.xlsx', XLSX_CONTENT_TYPE, len(self.content), None)
+        try:
+            upload.write(self.content)
+            upload.flush()
+            self.assertEqual(get_file_source(upload), upload.temporary_file_path())
+            self.assertTrue(os.path.exists(get_file_source(upload)))
+            worksheet = open_worksheet(upload)
+            self.assertEqual(list(worksheet.values), [('Code',), (1,), (2,)])
+            worksheet.parent.close()
+        finally:
+            upload.close()
+
+    def test_opened_workbook_is_closed_on_exit(self):
+        with opened_workbook(BytesIO(self.content)) as workbook:
+            self.assertIsNotNone(workbook._archive.fp)
+        self.assertIsNone(workbook._archive.fp)
+
+        workbook = Workbook()
+        with opened_workbook(workbook) as opened:
+            self.assertIs(opened, workbook)
+
+    def test_error_workbook_after_from_file(self):
+        upload = InMemoryUploadedFile(
+            BytesIO(create_content([1, 'A'])), 'file', 'codes.xlsx', XLSX_CONTENT_TYPE, None, None
+        )
+        serializer = CodeExcelSerializer.from_file(upload)
+        self.assertTrue(serializer.validation_errors)
+        self.assertIsNone(serializer.worksheet.parent._archive.fp)
+
+        output = serializer.write_error_workbook(BytesIO())
+        worksheet = load_workbook(output).active
+        self.assertEqual([row[0].value for row in worksheet.iter_rows()], ['Code', 1, 'A'])
+        self.assertIsNotNone(worksheet['A3'].comment)
@@ -0,0 +1,53 @@
+import unittest
+
+from django.test.utils import override_settings
+from django.utils import translation
+
+from django_excel_tools import fields, utils
+
+
+class TranslationCacheTest(unittest.TestCase):
+    def setUp(self):
+        utils.gettext('')
+        self.original_gettext = utils._django_gettext
+        self.lookups = []
+
+        def counting_gettext(message):
+            self.lookups.append(message)
+            return self.original_gettext(message)
+
+        utils._django_gettext = counting_gettext
+        utils.clear_translation_cache()
+
+    def tearDown(self):
+        utils._django_gettext = self.original_gettext
+        utils.clear_translation_cache()
+
+    def validate_errors(self, count):
+        field = fields.IntegerField(verbose_name='Code')
+        messages = []
+        for index in range(count):
+            field.value = 'A'
+            try:
+                field.validate(index=index)
+            except fields.ValidationError as error:
+                messages.append(error.message)
+        return messages
+
+    def test_catalog_looked_up_once_per_language(self):
+        with translation.override('ja'):
+            messages = self.validate_errors(100)
+        self.assertEqual(messages[1], u'[1行目] Code A を番号に変換できません')
+        self.assertEqual(len(self.lookups), 2)
+
+        with translation.override('en'):
+            messages = self.validate_errors(100)
+        self.assertEqual(messages[1], '[Row 1] Code cannot convert A to number.')
+        self.assertEqual(len(self.lookups), 4)
+
+    def test_cache_cleared_when_settings_changed(self):
+        with translation.override('en'):
+            self.validate_errors(1)
+            with override_settings(LANGUAGE_CODE='en'):
+                self.validate_errors(1)
+        self.assertEqual(len(self.lookups), 4)
@@ -0,0 +1,93 @@
+import unittest
+
+from django.utils import translation
+
+from django_excel_tools import fields, validators
+from django_excel_tools.exceptions import ValidationError
+
+
+class ValidatorTest(unittest.TestCase):
+    def test_min_max_value(self):
+        validators.MinValueValidator(1)(1)
+        validators.MaxValueValidator(1)(1)
+        with self.assertRaises(ValidationError):
+            validators.MinValueValidator(1)(0)
+        with self.assertRaises(ValidationError):
+            validators.MaxValueValidator(1)(2)
+
+    def test_length(self):
+        validators.MinLengthValidator(2)('ab')
+        with self.assertRaises(ValidationError):
+            validators.MinLengthValidator(2)('a')
+        with self.assertRaises(ValidationError):
+            validators.MaxLengthValidator(2)('abc')
+
+    def test_regex(self):
+        validator = validators.RegexValidator(r'[A-Z]+\d+$')
+        validator('AB12')
+        with self.assertRaises(ValidationError):
+            validator('ab12')
+        with self.assertRaises(ValidationError):
+            validators.RegexValidator(r'\d', inverse_match=True)('1')
+
+    def test_email(self):
+        validator = validators.EmailValidator()
+        validator('staff@example.com')
+        for value in ['staff', 'staff@example', 'st aff@example.com']:
+            with self.assertRaises(ValidationError):
+                validator(value)
+
+    def test_custom_message(self):
+        validator = validators.MaxValueValidator(10, message='%(value)s is over %(limit)s')
+        with self.assertRaises(ValidationError) as context:
+            validator(11)
+        self.assertEqual(context.exception.message, '11 is over 10')
+
+    def test_translated_message(self):
+        with translation.override('ja'):
+            with self.assertRaises(ValidationError) as context:
+                validators.MaxValueValidator(10)(11)
+        self.assertEqual(context.exception.message, u'10以下にしてください。')
+
+
+class FieldValidatorsTest(unittest.TestCase):
+    def test_validators_run_on_cleaned_value(self):
+        field = fields.IntegerField(verbose_name='Code', validators=[validators.MinValueValidator(10)])
+        field.value = '10'
+        field.validate(index=1)
+        self.assertEqual(field.cleaned_value, 10)
+
+        field.value = '9'
+        with self.assertRaises(ValidationError) as context:
+            field.validate(index=1)
+        self.assertIn('[Row 1] Code must be greater than or equal to 10.', context.exception.message)
+
+    def test_first_failing_validator_stops(self):
+        calls = []
+
+        def record(value):
+            calls.append(value)
+
+        field = fields.CharField(
+            max_length=10,
+            verbose_name='Code',
+            validators=[validators.MinLengthValidator(3), record]
+        )
+        field.value = 'ab'
+        with self.assertRaises(ValidationError):
+            field.validate(index=1)
+        self.assertEqual(calls, [])
+
+        field.value = 'abc'
+        field.validate(index=1)
+        self.assertEqual(calls, ['abc'])
+
+    def test_blank_value_is_not_validated(self):
+        field = fields.CharField(
+            max_length=10,
+            verbose_name='Code',
+            blank=True,
+            validators=[validators.MinLengthValidator(3)]
+        )
+        field.validate(index=1)
+        self.assertIsNone(field.cleaned_value)
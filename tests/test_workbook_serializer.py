@@ -0,0 +1,111 @@
+import unittest
+from io import BytesIO
+
+from openpyxl import Workbook
+
+from django_excel_tools import serializers
+from django_excel_tools.exceptions import SerializerConfigError, ValidationError
+
+
+class CustomerSerializer(serializers.ExcelSerializer):
+    code = serializers.CharField(max_length=10, verbose_name='Code')
+    name = serializers.CharField(max_length=20, verbose_name='Name')
+
+    class Meta:
+        start_index = 1
+        fields = ('code', 'name')
+
+    def import_operation(self, cleaned_data):
+        for index, row in enumerate(cleaned_data):
+            row['pk'] = index + 1
+
+
+class OrderSerializer(serializers.ExcelSerializer):
+    order_number = serializers.CharField(max_length=10, verbose_name='Order Number')
+    customer = serializers.CharField(max_length=10, verbose_name='Customer')
+
+    class Meta:
+        start_index = 1
+        fields = ('order_number', 'customer')
+
+    def extra_clean_customer(self, value):
+        customer = self.workbook.lookup('Customers', value)
+        if customer is None:
+            raise ValidationError('Customer {} does not exist.'.format(value))
+        return customer
+
+    def import_operation(self, cleaned_data):
+        self.imported = [
+            (row['order_number'], row['customer']['pk']) for row in cleaned_data
+        ]
+
+
+class SupplierWorkbookSerializer(serializers.WorkbookSerializer):
+
+    class Meta:
+        sheets = (
+            ('Orders', OrderSerializer),
+            ('Customers', CustomerSerializer),
+        )
+        dependencies = {'Orders': ('Customers',)}
+        lookups = {'Customers': 'code'}
+
+
+class TestWorkbookSerializer(unittest.TestCase):
+    def setUp(self):
+        self.workbook = Workbook()
+        customers = self.workbook.active
+        customers.title = 'Customers'
+        customers.append(['Code', 'Name'])
+        customers.append(['C1', 'Customer 1'])
+        customers.append(['C2', 'Customer 2'])
+
+        self.orders = self.workbook.create_sheet('Orders')
+        self.orders.append(['Order Number', 'Customer'])
+        self.orders.append(['O1', 'C2'])
+        self.orders.append(['O2', 'C1'])
+
+    def test_sheets_processed_in_dependency_order(self):
+        serializer = SupplierWorkbookSerializer(self.workbook)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertEqual(serializer.sheet_names, ['Customers', 'Orders'])
+        self.assertEqual(
+            serializer.serializers['Orders'].imported,
+            [('O1', 2), ('O2', 1)]
+        )
+
+    def test_file_is_read_only_and_closed(self):
+        fileobj = BytesIO()
+        self.workbook.save(fileobj)
+        serializer = SupplierWorkbookSerializer(fileobj)
+        self.assertEqual(serializer.validation_errors, [])
+        self.assertTrue(serializer.workbook.read_only)
+        self.assertIsNone(serializer.workbook._archive.fp)
+
+    def test_unresolved_key_is_reported_with_sheet_name(self):
+        self.orders.append(['O3', 'C9'])
+        serializer = SupplierWorkbookSerializer(self.workbook)
+        self.assertEqual(
+            serializer.validation_errors,
+            ['[Orders] [Row 4] Customer C9 does not exist.']
+        )
+
+    def test_missing_sheet(self):
+        del self.workbook['Orders']
+        serializer = SupplierWorkbookSerializer(self.workbook)
+        self.assertEqual(
+            serializer.validation_errors,
+            ['Sheet "Orders" is not found in this excel.']
+        )
+
+    def test_circular_dependency(self):
+        class Serializer(serializers.WorkbookSerializer):
+            class Meta:
+                sheets = (
+                    ('Orders', OrderSerializer),
+                    ('Customers', CustomerSerializer),
+                )
+                dependencies = {'Orders': ('Customers',), 'Customers': ('Orders',)}
+
+        with self.assertRaises(SerializerConfigError):
+            Serializer(self.workbook)